@@ -5,7 +5,7 @@ import click
 import sys
 from pathlib import Path
 
-from .models import ContactGraph, import_pipeline, Contact
+from .models import ContactGraph, import_pipeline, Contact, FilterContext
 from .serializers import vcard, yaml_serializer, markdown
 from .filters import UIDFilter, GenderFilter
 
@@ -30,7 +30,7 @@ def cli():
 @click.argument('graph_file', type=click.Path())
 @click.option('--format', type=click.Choice(['vcard', 'yaml', 'markdown']), default='vcard',
               help='Format of files to import (default: vcard)')
-@click.option('--graph-format', type=click.Choice(['graphml', 'json']), default=None,
+@click.option('--graph-format', type=click.Choice(['graphml', 'json', 'msgpack']), default=None,
               help='Format for graph file (default: auto-detect from extension)')
 @click.option('--verbose', is_flag=True, help='Enable verbose output')
 def import_contacts(folder_path, graph_file, format, graph_format, verbose):
@@ -40,7 +40,7 @@ def import_contacts(folder_path, graph_file, format, graph_format, verbose):
     Missing fields in imported contacts do not delete existing graph data.
     
     FOLDER_PATH: Path to folder containing contact files
-    GRAPH_FILE: Path to save the contact graph (.graphml or .json)
+    GRAPH_FILE: Path to save the contact graph (.graphml, .json or .msgpack)
     """
     if verbose:
         click.echo(f"Importing {format} files from {folder_path}...")
@@ -68,27 +68,15 @@ def import_contacts(folder_path, graph_file, format, graph_format, verbose):
         except Exception as e:
             click.echo(f"Warning: Could not load existing graph: {e}", err=True)
     
-    # Merge contacts into graph using intelligent merging
-    added = 0
-    updated = 0
-    skipped = 0
+    # Apply filters to contacts that still need a UID
+    context = FilterContext(pipeline_name="import")
+    contacts = [
+        contact if contact.uid else import_pipeline.run(contact, context)
+        for contact in contacts
+    ]
     
-    for contact in contacts:
-        if not contact.uid:
-            # Apply filters if needed
-            from .models import FilterContext
-            context = FilterContext(pipeline_name="import")
-            contact = import_pipeline.run(contact, context)
-        
-        # Use merge_contact for intelligent merging
-        modified, action = graph.merge_contact(contact)
-        
-        if action == "added":
-            added += 1
-        elif action == "updated":
-            updated += 1
-        elif action == "skipped":
-            skipped += 1
+    # Merge contacts into graph using intelligent merging
+    added, updated, skipped = graph.merge_contacts(contacts)
     
     # Save graph
     graph.save(graph_file, format=graph_format)
@@ -106,7 +94,7 @@ def import_contacts(folder_path, graph_file, format, graph_format, verbose):
 @click.argument('output_folder', type=click.Path())
 @click.option('--format', type=click.Choice(['vcard', 'yaml', 'markdown']), default='vcard',
               help='Format to export (default: vcard)')
-@click.option('--graph-format', type=click.Choice(['graphml', 'json']), default=None,
+@click.option('--graph-format', type=click.Choice(['graphml', 'json', 'msgpack']), default=None,
               help='Format for graph file (default: auto-detect from extension)')
 @click.option('--force', is_flag=True, help='Force overwrite all files (ignore change detection)')
 @click.option('--verbose', is_flag=True, help='Enable verbose output')
@@ -116,7 +104,7 @@ def export_contacts(graph_file, output_folder, format, graph_format, force, verb
     Only writes files when data has changed to minimize file system operations.
     Use --force to override and write all files.
     
-    GRAPH_FILE: Path to the contact graph file (.graphml or .json)
+    GRAPH_FILE: Path to the contact graph file (.graphml, .json or .msgpack)
     OUTPUT_FOLDER: Path to folder where contacts will be exported
     """
     if verbose:
@@ -171,12 +159,12 @@ def export_contacts(graph_file, output_folder, format, graph_format, force, verb
 
 @cli.command()
 @click.argument('graph_file', type=click.Path(exists=True))
-@click.option('--graph-format', type=click.Choice(['graphml', 'json']), default=None,
+@click.option('--graph-format', type=click.Choice(['graphml', 'json', 'msgpack']), default=None,
               help='Format for graph file (default: auto-detect from extension)')
 def list_contacts(graph_file, graph_format):
     """List all contacts in the graph.
     
-    GRAPH_FILE: Path to the contact graph file (.graphml or .json)
+    GRAPH_FILE: Path to the contact graph file (.graphml, .json or .msgpack)
     """
     # Load graph
     graph = ContactGraph()
@@ -215,12 +203,12 @@ def list_contacts(graph_file, graph_format):
 @cli.command()
 @click.argument('graph_file', type=click.Path(exists=True))
 @click.argument('query')
-@click.option('--graph-format', type=click.Choice(['graphml', 'json']), default=None,
+@click.option('--graph-format', type=click.Choice(['graphml', 'json', 'msgpack']), default=None,
               help='Format for graph file (default: auto-detect from extension)')
 def search(graph_file, query, graph_format):
     """Search for contacts by name or email in the graph.
     
-    GRAPH_FILE: Path to the contact graph file (.graphml or .json)
+    GRAPH_FILE: Path to the contact graph file (.graphml, .json or .msgpack)
     QUERY: Search query (case-insensitive)
     """
     # Load graph
@@ -275,7 +263,7 @@ def search(graph_file, query, graph_format):
 @click.argument('graph_file', type=click.Path())
 @click.argument('target_folder', type=click.Path())
 @click.argument('target_format', type=click.Choice(['vcard', 'markdown', 'yaml']))
-@click.option('--graph-format', type=click.Choice(['graphml', 'json']), default=None,
+@click.option('--graph-format', type=click.Choice(['graphml', 'json', 'msgpack']), default=None,
               help='Format for graph file (default: auto-detect from extension)')
 @click.option('--verbose', is_flag=True, help='Enable verbose output')
 def convert(source_folder, source_format, graph_file, target_folder, target_format, graph_format, verbose):
@@ -283,7 +271,7 @@ def convert(source_folder, source_format, graph_file, target_folder, target_form
     
     SOURCE_FOLDER: Path to folder with source contacts
     SOURCE_FORMAT: Format of source files (vcard or markdown)
-    GRAPH_FILE: Path to save/load the contact graph (.graphml or .json)
+    GRAPH_FILE: Path to save/load the contact graph (.graphml, .json or .msgpack)
     TARGET_FOLDER: Path to folder for converted contacts
     TARGET_FORMAT: Format to convert to (vcard, markdown, or yaml)
     """
@@ -309,25 +297,15 @@ def convert(source_folder, source_format, graph_file, target_folder, target_form
         except Exception as e:
             click.echo(f"Warning: Could not load existing graph: {e}", err=True)
     
-    # Add contacts to graph using intelligent merging
-    added = 0
-    updated = 0
-    skipped = 0
+    # Apply filters to contacts that still need a UID
+    context = FilterContext(pipeline_name="import")
+    contacts = [
+        contact if contact.uid else import_pipeline.run(contact, context)
+        for contact in contacts
+    ]
     
-    for contact in contacts:
-        if not contact.uid:
-            from .models import FilterContext
-            context = FilterContext(pipeline_name="import")
-            contact = import_pipeline.run(contact, context)
-        
-        # Use merge_contact for intelligent merging
-        modified, action = graph.merge_contact(contact)
-        if action == "added":
-            added += 1
-        elif action == "updated":
-            updated += 1
-        elif action == "skipped":
-            skipped += 1
+    # Merge contacts into graph using intelligent merging
+    added, updated, skipped = graph.merge_contacts(contacts)
     
     # Save graph
     graph.save(graph_file, format=graph_format)
@@ -1,7 +1,7 @@
 """
 Models package for PPL.
 """
-from .contact import Contact, Related
+from .contact import Contact, Related, index_by_fn
 from .relationship import Relationship
 from .graph import ContactGraph
 from .filter import AbstractFilter, FilterContext
@@ -10,6 +10,7 @@ from .pipeline import FilterPipeline, import_pipeline, export_pipeline, curation
 __all__ = [
     'Contact',
     'Related',
+    'index_by_fn',
     'Relationship',
     'ContactGraph',
     'AbstractFilter',
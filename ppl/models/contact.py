@@ -3,7 +3,7 @@ Contact model representing a vCard 4.0 entity.
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterable
 
 
 @dataclass
@@ -215,3 +215,21 @@ class Related:
     # Family: child, parent, sibling, spouse, kin
     # Romantic: muse, crush, date, sweetheart
     # Special: me, agent, emergency
+
+
+def index_by_fn(contacts: Iterable[Contact]) -> Dict[str, Contact]:
+    """
+    Build a lookup table of contacts keyed by formatted name.
+    
+    When several contacts share an FN, the first one wins.
+    
+    Args:
+        contacts: Contacts to index
+        
+    Returns:
+        Dictionary mapping FN to Contact
+    """
+    index: Dict[str, Contact] = {}
+    for contact in contacts:
+        index.setdefault(contact.fn, contact)
+    return index
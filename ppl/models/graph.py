@@ -4,11 +4,133 @@ Contact graph manager using NetworkX.
 import networkx as nx
 import pickle
 import json
-from typing import List, Optional, Dict, Tuple
+from datetime import date, datetime, time
+from typing import Iterable, List, Optional, Dict, Tuple
 from pathlib import Path
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
 from .contact import Contact
 from .relationship import Relationship
 
+# orjson is an optional speedup for JSON graph files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is only needed for the binary msgpack graph format
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Graph file extensions recognized when no format is given; others are GraphML
+_GRAPH_FORMAT_EXTENSIONS = {
+    '.json': 'json',
+    '.msgpack': 'msgpack',
+}
+
+# Position of each merge_contact action in the counts from merge_contacts
+_MERGE_ACTION_INDEX = {
+    'added': 0,
+    'updated': 1,
+    'skipped': 2,
+}
+
+
+GRAPHML_NS = "http://graphml.graphdrawing.org/xmlns"
+_GRAPHML_TAG = f"{{{GRAPHML_NS}}}"
+
+# Node attributes written by _serialize_contact, declared up front as GraphML keys
+_GRAPHML_NODE_KEYS = (
+    'fn', 'version', 'uid', 'n', 'rev', 'email', 'tel', 'adr', 'org',
+    'title', 'role', 'note', 'categories', 'url', 'nickname', 'bday',
+    'anniversary', 'gender', 'photo', 'tz', 'geo', 'related',
+)
+
+# String templates for the GraphML write path; values must be escaped first
+_GRAPHML_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    f'<graphml xmlns="{GRAPHML_NS}">\n'
+)
+_GRAPHML_KEY_TMPL = '<key id={key} for="{domain}" attr.name={name} attr.type="{type}"/>\n'
+
+# Prefix for edge key ids, keeping them distinct from node keys of the same name
+_GRAPHML_EDGE_KEY_PREFIX = 'e_'
+_GRAPHML_DATA_TMPL = '<data key={key}>{value}</data>'
+_GRAPHML_GRAPH_OPEN = '<graph edgedefault="directed">\n'
+_GRAPHML_FOOTER = '</graph>\n</graphml>\n'
+
+
+def _detect_graph_format(file_path: str) -> str:
+    """
+    Infer the graph file format from its extension.
+    
+    Args:
+        file_path: Path to the graph file
+        
+    Returns:
+        Format name; 'graphml' for unrecognized extensions
+    """
+    return _GRAPH_FORMAT_EXTENSIONS.get(Path(file_path).suffix.lower(), 'graphml')
+
+
+def _require_msgpack() -> None:
+    """
+    Ensure the optional msgpack dependency is available.
+    
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError("The msgpack graph format requires the 'msgpack' package")
+
+
+def _json_default(value):
+    """
+    Encode values JSON has no type for, the same way for orjson and json.
+    
+    Args:
+        value: Value the encoder could not serialize
+        
+    Returns:
+        JSON-compatible replacement (ISO 8601 string for dates and times)
+        
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Dict) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON.
+    
+    Uses orjson when installed and falls back to the standard library for
+    values orjson cannot encode (such as non-string keys). Both encoders
+    share _json_default, so dates and times are written identically and
+    finite floats decode to the same values, though their notation may
+    differ (1e16 vs 1e+16). orjson writes NaN and infinities as null.
+    
+    Args:
+        data: JSON-compatible data
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
 
 class ContactGraph:
     """
@@ -23,6 +145,35 @@ class ContactGraph:
         self.graph = nx.DiGraph()  # Directed graph to support directional relationships
         self._contacts: Dict[str, Contact] = {}  # UID -> Contact mapping for quick access
     
+    @classmethod
+    def from_contacts(cls, contacts: Iterable[Contact],
+                      relationships: Iterable[Relationship] = ()) -> 'ContactGraph':
+        """
+        Build a graph from contacts and, optionally, their relationships.
+        
+        Nodes and edges are inserted in bulk rather than one call at a time.
+        
+        Args:
+            contacts: Contacts to add
+            relationships: Relationships between those contacts
+            
+        Returns:
+            New ContactGraph
+            
+        Raises:
+            ValueError: If a contact has no UID or a relationship endpoint
+                is not among the contacts
+        """
+        contacts = list(contacts)
+        if not all(contact.uid for contact in contacts):
+            raise ValueError("Contact must have a UID to be added to graph")
+        
+        graph = cls()
+        graph._contacts.update((contact.uid, contact) for contact in contacts)
+        graph.graph.add_nodes_from((contact.uid, {'contact': contact}) for contact in contacts)
+        graph.add_relationships(relationships)
+        return graph
+    
     def add_contact(self, contact: Contact) -> None:
         """
         Add a contact to the graph.
@@ -70,7 +221,8 @@ class ContactGraph:
             - Compare REV timestamps
             - If incoming is newer or equal, merge data
             - Return (True, "updated") if changes made
-            - Return (False, "skipped") if incoming is older
+            - Return (False, "skipped") if incoming is older or
+              identical to the existing contact
         
         Args:
             contact: Contact to add or merge
@@ -96,11 +248,40 @@ class ContactGraph:
             # Existing is newer, skip incoming
             return (False, "skipped")
         
+        # Identical data would merge to a no-op. Dataclass equality builds
+        # tuples of every field, so it is only tried once REV already matches
+        if rev_comparison == 0 and (existing is contact or existing == contact):
+            return (False, "skipped")
+        
         # Incoming is newer or equal, merge it
         existing.merge_from(contact, prefer_newer=True)
         self.update_contact(existing)
         return (True, "updated")
     
+    def merge_contacts(self, contacts: Iterable[Contact]) -> List[int]:
+        """
+        Merge a batch of contacts into the graph.
+        
+        Contacts are merged in order with the same rules as merge_contact,
+        so a UID appearing twice in the batch is compared against the
+        already-merged state.
+        
+        Args:
+            contacts: Contacts to add or merge
+            
+        Returns:
+            Counts of each outcome as [added, updated, skipped]
+        """
+        counts = [0, 0, 0]
+        merge = self.merge_contact
+        index = _MERGE_ACTION_INDEX
+        
+        for contact in contacts:
+            _, action = merge(contact)
+            counts[index[action]] += 1
+        
+        return counts
+    
     def get_contact(self, uid: str) -> Optional[Contact]:
         """
         Get a contact by UID.
@@ -136,6 +317,50 @@ class ContactGraph:
         Raises:
             ValueError: If source or target contacts are not in graph
         """
+        self._check_relationship(rel)
+        
+        # Add edge with relationship data as attributes
+        self.graph.add_edge(
+            rel.source.uid,
+            rel.target.uid,
+            types=rel.types,
+            directional=rel.directional,
+            metadata=rel.metadata
+        )
+    
+    def add_relationships(self, rels: Iterable[Relationship]) -> None:
+        """
+        Add a batch of relationships to the graph.
+        
+        Every relationship is validated before any edge is added, so an
+        invalid entry leaves the graph unchanged.
+        
+        Args:
+            rels: Relationships to add
+            
+        Raises:
+            ValueError: If any source or target contact is not in graph
+        """
+        rels = list(rels)
+        for rel in rels:
+            self._check_relationship(rel)
+        
+        self.graph.add_edges_from(
+            (rel.source.uid, rel.target.uid,
+             {'types': rel.types, 'directional': rel.directional, 'metadata': rel.metadata})
+            for rel in rels
+        )
+    
+    def _check_relationship(self, rel: Relationship) -> None:
+        """
+        Validate that a relationship's endpoints are contacts in the graph.
+        
+        Args:
+            rel: Relationship to validate
+            
+        Raises:
+            ValueError: If source or target contacts are missing or not in graph
+        """
         if not rel.source or not rel.source.uid:
             raise ValueError("Relationship source must have a UID")
         
@@ -147,15 +372,6 @@ class ContactGraph:
         
         if rel.target.uid not in self._contacts:
             raise ValueError(f"Target contact {rel.target.uid} not in graph")
-        
-        # Add edge with relationship data as attributes
-        self.graph.add_edge(
-            rel.source.uid,
-            rel.target.uid,
-            types=rel.types,
-            directional=rel.directional,
-            metadata=rel.metadata
-        )
     
     def get_relationships(self, uid: str) -> List[Relationship]:
         """
@@ -167,28 +383,17 @@ class ContactGraph:
         Returns:
             List of Relationship objects where the contact is the source
         """
-        relationships = []
-        
-        if not self.graph.has_node(uid):
-            return relationships
-        
         source_contact = self._contacts.get(uid)
         if not source_contact:
-            return relationships
+            return []
         
-        # Get outgoing edges (where this contact is the source)
-        for _, target_uid, edge_data in self.graph.out_edges(uid, data=True):
-            target_contact = self._contacts.get(target_uid)
-            if target_contact:
-                relationships.append(Relationship(
-                    source=source_contact,
-                    target=target_contact,
-                    types=edge_data.get('types', []),
-                    directional=edge_data.get('directional', True),
-                    metadata=edge_data.get('metadata', {})
-                ))
+        # Read the successor adjacency dict directly instead of going
+        # through an out_edges view
+        successors = self.graph.succ.get(uid)
+        if not successors:
+            return []
         
-        return relationships
+        return self._relationships_from(source_contact, successors)
     
     def get_all_contacts(self) -> List[Contact]:
         """
@@ -207,9 +412,39 @@ class ContactGraph:
             List of all Relationship objects
         """
         relationships = []
+        succ = self.graph.succ
+        
+        for source_uid, source_contact in self._contacts.items():
+            successors = succ.get(source_uid)
+            if successors:
+                relationships.extend(self._relationships_from(source_contact, successors))
+        
+        return relationships
+    
+    def _relationships_from(self, source_contact: Contact, successors: Dict[str, dict]) -> List[Relationship]:
+        """
+        Build Relationship objects from a node's successor adjacency.
+        
+        Args:
+            source_contact: Contact at the source of the edges
+            successors: Mapping of target UID to edge data
+            
+        Returns:
+            List of Relationship objects with resolved targets
+        """
+        contacts = self._contacts
+        relationships = []
         
-        for source_uid in self._contacts:
-            relationships.extend(self.get_relationships(source_uid))
+        for target_uid, edge_data in successors.items():
+            target_contact = contacts.get(target_uid)
+            if target_contact:
+                relationships.append(Relationship(
+                    source=source_contact,
+                    target=target_contact,
+                    types=edge_data.get('types', []),
+                    directional=edge_data.get('directional', True),
+                    metadata=edge_data.get('metadata', {})
+                ))
         
         return relationships
     
@@ -217,26 +452,24 @@ class ContactGraph:
         """
         Save the contact graph to disk.
         
-        Supports GraphML and JSON formats. Format is auto-detected from file extension
-        if not specified.
+        Supports GraphML, JSON and msgpack formats. Format is auto-detected from
+        file extension if not specified.
         
         Args:
             file_path: Path to save the graph file
-            format: Format to use ('graphml' or 'json'). Auto-detected if None.
+            format: Format to use ('graphml', 'json' or 'msgpack'). Auto-detected if None.
         """
         # Determine format from extension if not specified
         if format is None:
-            ext = Path(file_path).suffix.lower()
-            if ext == '.json':
-                format = 'json'
-            else:
-                format = 'graphml'
+            format = _detect_graph_format(file_path)
         
         # Ensure directory exists
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         
         if format == 'json':
             self._save_json(file_path)
+        elif format == 'msgpack':
+            self._save_msgpack(file_path)
         else:
             self._save_graphml(file_path)
     
@@ -244,34 +477,116 @@ class ContactGraph:
         """
         Save the contact graph to disk using GraphML format.
         
-        The graph structure is saved as GraphML, and Contact objects are serialized
-        as JSON in the node attributes.
+        The document is streamed to disk one node/edge at a time from string
+        templates rather than building an intermediate graph and XML tree.
+        Contact objects are serialized as JSON strings in the node attributes.
         
         Args:
             file_path: Path to save the graph file
         """
-        # Create a copy of the graph for serialization
-        export_graph = nx.DiGraph()
+        # GraphML requires all keys to be declared before the graph element,
+        # so collect edge attribute types in a cheap first pass
+        edge_keys: Dict[str, str] = {}
+        for _, _, data in self.graph.edges(data=True):
+            for key, value in data.items():
+                if key not in edge_keys and value is not None:
+                    edge_keys[key] = self._graphml_type(value)
         
-        # Add nodes with serialized contact data
-        for uid, contact in self._contacts.items():
-            # Serialize contact to dict
-            contact_data = self._serialize_contact(contact)
-            export_graph.add_node(uid, **contact_data)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(_GRAPHML_HEADER)
+            f.writelines(
+                _GRAPHML_KEY_TMPL.format(
+                    key=quoteattr(key), name=quoteattr(key), domain='node', type='string'
+                )
+                for key in _GRAPHML_NODE_KEYS
+            )
+            f.writelines(
+                _GRAPHML_KEY_TMPL.format(
+                    key=quoteattr(_GRAPHML_EDGE_KEY_PREFIX + key), name=quoteattr(key),
+                    domain='edge', type=attr_type
+                )
+                for key, attr_type in edge_keys.items()
+            )
+            f.write(_GRAPHML_GRAPH_OPEN)
+            
+            # Write nodes with serialized contact data
+            f.writelines(
+                f'<node id={quoteattr(uid)}>'
+                f'{self._graphml_data(self._serialize_contact(contact))}</node>\n'
+                for uid, contact in self._contacts.items()
+            )
+            
+            # Write edges with their attributes (serialize lists as JSON)
+            f.writelines(
+                f'<edge source={quoteattr(u)} target={quoteattr(v)}>'
+                f'{self._graphml_data(self._graphml_edge_values(data))}</edge>\n'
+                for u, v, data in self.graph.edges(data=True)
+            )
+            
+            f.write(_GRAPHML_FOOTER)
+    
+    @staticmethod
+    def _graphml_data(values: Dict[str, str]) -> str:
+        """
+        Render GraphML <data> elements for a node or edge.
         
-        # Copy all edges with their attributes (serialize lists as JSON)
-        for u, v, data in self.graph.edges(data=True):
-            edge_data = {}
-            for key, value in data.items():
-                if isinstance(value, (list, dict)):
-                    # Serialize complex types as JSON
-                    edge_data[key] = json.dumps(value)
-                else:
-                    edge_data[key] = value
-            export_graph.add_edge(u, v, **edge_data)
+        None values are omitted, as GraphML has no null value.
         
-        # Write to GraphML
-        nx.write_graphml(export_graph, file_path)
+        Args:
+            values: Mapping of GraphML key id to string value
+            
+        Returns:
+            Concatenated, escaped <data> elements
+        """
+        return ''.join(
+            _GRAPHML_DATA_TMPL.format(key=quoteattr(key), value=escape(value))
+            for key, value in values.items()
+            if value is not None
+        )
+    
+    @staticmethod
+    def _graphml_edge_values(data: Dict) -> Dict[str, str]:
+        """
+        Convert edge attributes to GraphML string values.
+        
+        Args:
+            data: Edge attribute dictionary
+            
+        Returns:
+            Dictionary of edge key id to string value, without None values
+        """
+        values = {}
+        for key, value in data.items():
+            key_id = _GRAPHML_EDGE_KEY_PREFIX + key
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                values[key_id] = 'true' if value else 'false'
+            elif isinstance(value, (list, dict)):
+                # Serialize complex types as JSON
+                values[key_id] = json.dumps(value)
+            else:
+                values[key_id] = str(value)
+        return values
+    
+    @staticmethod
+    def _graphml_type(value) -> str:
+        """
+        Map a Python value to its GraphML attr.type.
+        
+        Args:
+            value: Attribute value
+            
+        Returns:
+            GraphML type name
+        """
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, int):
+            return 'long'
+        if isinstance(value, float):
+            return 'double'
+        return 'string'
     
     def _save_json(self, file_path: str) -> None:
         """
@@ -288,7 +603,30 @@ class ContactGraph:
         Args:
             file_path: Path to save the graph file
         """
-        # Build JSON structure
+        Path(file_path).write_bytes(_dump_json(self._graph_document()))
+    
+    def _save_msgpack(self, file_path: str) -> None:
+        """
+        Save the contact graph to disk using msgpack format.
+        
+        Stores the same document as the JSON format in msgpack's binary encoding.
+        
+        Args:
+            file_path: Path to save the graph file
+            
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        _require_msgpack()
+        Path(file_path).write_bytes(msgpack.packb(self._graph_document(), use_bin_type=True))
+    
+    def _graph_document(self) -> Dict:
+        """
+        Build the graphology document shared by the JSON and msgpack formats.
+        
+        Returns:
+            Dictionary with attributes, options, nodes and edges
+        """
         graph_data = {
             "attributes": {
                 "name": "Contact Graph"
@@ -325,20 +663,18 @@ class ContactGraph:
             
             graph_data["edges"].append(edge)
         
-        # Write to JSON file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, indent=2, ensure_ascii=False)
+        return graph_data
     
     def load(self, file_path: str, format: Optional[str] = None) -> None:
         """
         Load a contact graph from disk.
         
-        Supports GraphML and JSON formats. Format is auto-detected from file extension
-        if not specified.
+        Supports GraphML, JSON and msgpack formats. Format is auto-detected from
+        file extension if not specified.
         
         Args:
             file_path: Path to the graph file
-            format: Format to use ('graphml' or 'json'). Auto-detected if None.
+            format: Format to use ('graphml', 'json' or 'msgpack'). Auto-detected if None.
             
         Raises:
             FileNotFoundError: If the file doesn't exist
@@ -348,14 +684,12 @@ class ContactGraph:
         
         # Determine format from extension if not specified
         if format is None:
-            ext = Path(file_path).suffix.lower()
-            if ext == '.json':
-                format = 'json'
-            else:
-                format = 'graphml'
+            format = _detect_graph_format(file_path)
         
         if format == 'json':
             self._load_json(file_path)
+        elif format == 'msgpack':
+            self._load_msgpack(file_path)
         else:
             self._load_graphml(file_path)
     
@@ -363,36 +697,65 @@ class ContactGraph:
         """
         Load a contact graph from GraphML format.
         
+        The file is parsed incrementally and each <node>/<edge> element is
+        removed from its <graph> parent once consumed, so the XML tree never
+        holds more than the element being read.
+        
         Args:
             file_path: Path to the graph file
         """
-        # Read GraphML
-        import_graph = nx.read_graphml(file_path)
-        
         # Clear current graph
         self.graph = nx.DiGraph()
-        self._contacts = {}
+        self._contacts.clear()
         
-        # Restore contacts from nodes
-        for uid in import_graph.nodes():
-            node_data = import_graph.nodes[uid]
-            contact = self._deserialize_contact(uid, node_data)
-            self._contacts[uid] = contact
-            self.graph.add_node(uid, contact=contact)
+        # GraphML key id -> (attribute name, attribute type)
+        keys: Dict[str, Tuple[str, str]] = {}
         
-        # Restore edges with deserialized attributes
-        for u, v, data in import_graph.edges(data=True):
-            edge_data = {}
-            for key, value in data.items():
-                # Try to deserialize JSON strings back to lists/dicts
-                if isinstance(value, str):
-                    try:
-                        edge_data[key] = json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
-                        edge_data[key] = value
-                else:
-                    edge_data[key] = value
-            self.graph.add_edge(u, v, **edge_data)
+        # <graph> element whose consumed children are discarded
+        parent = None
+        
+        for event, elem in ElementTree.iterparse(file_path, events=('start', 'end')):
+            tag = elem.tag
+            
+            if event == 'start':
+                if tag == _GRAPHML_TAG + 'graph':
+                    parent = elem
+            
+            elif tag == _GRAPHML_TAG + 'key':
+                key_id = elem.get('id')
+                keys[key_id] = (
+                    elem.get('attr.name', key_id),
+                    elem.get('attr.type', 'string')
+                )
+            
+            elif tag == _GRAPHML_TAG + 'node':
+                # Restore contact from node
+                uid = elem.get('id')
+                node_data = {}
+                for data in elem.iter(_GRAPHML_TAG + 'data'):
+                    name, _ = keys.get(data.get('key'), (data.get('key'), 'string'))
+                    node_data[name] = data.text or ''
+                contact = self._deserialize_contact(uid, node_data)
+                self._contacts[uid] = contact
+                self.graph.add_node(uid, contact=contact)
+                parent.clear()
+            
+            elif tag == _GRAPHML_TAG + 'edge':
+                # Restore edge with deserialized attributes
+                edge_data = {}
+                for data in elem.iter(_GRAPHML_TAG + 'data'):
+                    name, attr_type = keys.get(data.get('key'), (data.get('key'), 'string'))
+                    value = data.text or ''
+                    if attr_type == 'boolean':
+                        edge_data[name] = value.strip().lower() in ('true', '1')
+                    else:
+                        # Try to deserialize JSON strings back to lists/dicts
+                        try:
+                            edge_data[name] = json.loads(value)
+                        except (json.JSONDecodeError, TypeError):
+                            edge_data[name] = value
+                self.graph.add_edge(elem.get('source'), elem.get('target'), **edge_data)
+                parent.clear()
     
     def _load_json(self, file_path: str) -> None:
         """
@@ -407,9 +770,31 @@ class ContactGraph:
         with open(file_path, 'r', encoding='utf-8') as f:
             graph_data = json.load(f)
         
+        self._restore_document(graph_data)
+    
+    def _load_msgpack(self, file_path: str) -> None:
+        """
+        Load a contact graph from msgpack format.
+        
+        Args:
+            file_path: Path to the graph file
+            
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        _require_msgpack()
+        self._restore_document(msgpack.unpackb(Path(file_path).read_bytes(), raw=False))
+    
+    def _restore_document(self, graph_data: Dict) -> None:
+        """
+        Replace the graph contents with a graphology document.
+        
+        Args:
+            graph_data: Dictionary with nodes and edges
+        """
         # Clear current graph
         self.graph = nx.DiGraph()
-        self._contacts = {}
+        self._contacts.clear()
         
         # Restore contacts from nodes
         for node in graph_data.get("nodes", []):
@@ -530,100 +915,41 @@ class ContactGraph:
         from datetime import datetime
         from .contact import Related
         
-        # Create contact with required field
-        fn = data.get('fn', '')
-        contact = Contact(fn=fn)
-        
-        # Restore UID
-        contact.uid = data.get('uid', uid)
+        fields = {
+            'fn': data.get('fn', ''),
+            'uid': data.get('uid', uid),
+        }
         
         # Restore version
         if 'version' in data:
-            contact.version = data['version']
+            fields['version'] = data['version']
         
         # Restore REV
         if 'rev' in data:
             try:
-                contact.rev = datetime.fromisoformat(data['rev'])
+                fields['rev'] = datetime.fromisoformat(data['rev'])
             except (ValueError, AttributeError):
                 pass
         
         # Restore simple fields
-        if 'n' in data:
-            contact.n = data['n']
-        
-        if 'title' in data:
-            contact.title = data['title']
-        
-        if 'role' in data:
-            contact.role = data['role']
-        
-        if 'note' in data:
-            contact.note = data['note']
-        
-        if 'bday' in data:
-            contact.bday = data['bday']
-        
-        if 'anniversary' in data:
-            contact.anniversary = data['anniversary']
-        
-        if 'gender' in data:
-            contact.gender = data['gender']
-        
-        if 'photo' in data:
-            contact.photo = data['photo']
-        
-        if 'tz' in data:
-            contact.tz = data['tz']
+        for name in ('n', 'title', 'role', 'note', 'bday', 'anniversary',
+                     'gender', 'photo', 'tz'):
+            if name in data:
+                fields[name] = data[name]
         
         # Restore JSON-serialized list fields
-        if 'email' in data:
-            try:
-                contact.email = json.loads(data['email'])
-            except (json.JSONDecodeError, TypeError):
-                contact.email = [data['email']]
-        
-        if 'tel' in data:
-            try:
-                contact.tel = json.loads(data['tel'])
-            except (json.JSONDecodeError, TypeError):
-                contact.tel = [data['tel']]
-        
-        if 'adr' in data:
-            try:
-                contact.adr = json.loads(data['adr'])
-            except (json.JSONDecodeError, TypeError):
-                contact.adr = [data['adr']]
-        
-        if 'org' in data:
-            try:
-                contact.org = json.loads(data['org'])
-            except (json.JSONDecodeError, TypeError):
-                contact.org = [data['org']]
-        
-        if 'categories' in data:
-            try:
-                contact.categories = json.loads(data['categories'])
-            except (json.JSONDecodeError, TypeError):
-                contact.categories = [data['categories']]
-        
-        if 'url' in data:
-            try:
-                contact.url = json.loads(data['url'])
-            except (json.JSONDecodeError, TypeError):
-                contact.url = [data['url']]
-        
-        if 'nickname' in data:
-            try:
-                contact.nickname = json.loads(data['nickname'])
-            except (json.JSONDecodeError, TypeError):
-                contact.nickname = [data['nickname']]
+        for name in ('email', 'tel', 'adr', 'org', 'categories', 'url', 'nickname'):
+            if name in data:
+                try:
+                    fields[name] = json.loads(data[name])
+                except (json.JSONDecodeError, TypeError):
+                    fields[name] = [data[name]]
         
         if 'geo' in data:
             try:
                 geo_data = json.loads(data['geo'])
                 if isinstance(geo_data, list) and len(geo_data) == 2:
-                    contact.geo = tuple(geo_data)
+                    fields['geo'] = tuple(geo_data)
             except (json.JSONDecodeError, TypeError):
                 pass
         
@@ -631,15 +957,16 @@ class ContactGraph:
         if 'related' in data:
             try:
                 related_data = json.loads(data['related'])
-                for rel_dict in related_data:
-                    related = Related(
+                fields['related'] = [
+                    Related(
                         uri=rel_dict.get('uri', ''),
                         type=rel_dict.get('type', []),
                         text_value=rel_dict.get('text_value'),
                         pref=rel_dict.get('pref')
                     )
-                    contact.related.append(related)
+                    for rel_dict in related_data
+                ]
             except (json.JSONDecodeError, TypeError):
                 pass
         
-        return contact
+        return Contact(**fields)
@@ -33,7 +33,7 @@ class FilterPipeline:
         self.filters.append(filter)
         # Sort by priority (lower priority runs first)
         self.filters.sort(key=lambda f: f.priority)
-        self.logger.debug(f"Registered filter: {filter.name} (priority: {filter.priority})")
+        self.logger.debug("Registered filter: %s (priority: %s)", filter.name, filter.priority)
     
     def run(self, contact: 'Contact', context: 'FilterContext') -> 'Contact':
         """
@@ -46,20 +46,15 @@ class FilterPipeline:
         Returns:
             Processed contact
         """
-        for filter in self.filters:
-            if filter.should_run(context):
-                try:
-                    self.logger.debug(f"Running filter: {filter.name}")
-                    contact = filter.execute(contact, context)
-                except Exception as e:
-                    filter.on_error(contact, e)
-                    self.logger.error(f"{filter.name} failed: {e}")
-        return contact
+        return self._run_filters(contact, context, self._active_filters(context))
     
     def run_batch(self, contacts: List['Contact'], context: 'FilterContext') -> List['Contact']:
         """
         Execute pipeline on multiple contacts.
         
+        Filter applicability depends only on the context, so it is resolved
+        once for the whole batch.
+        
         Args:
             contacts: List of contacts to process
             context: Execution context
@@ -67,7 +62,42 @@ class FilterPipeline:
         Returns:
             List of processed contacts
         """
-        return [self.run(contact, context) for contact in contacts]
+        active = self._active_filters(context)
+        return [self._run_filters(contact, context, active) for contact in contacts]
+    
+    def _active_filters(self, context: 'FilterContext') -> List['AbstractFilter']:
+        """
+        Select the registered filters that should run in a context.
+        
+        Args:
+            context: Execution context
+            
+        Returns:
+            Filters to run, in priority order
+        """
+        return [filter for filter in self.filters if filter.should_run(context)]
+    
+    def _run_filters(self, contact: 'Contact', context: 'FilterContext',
+                     filters: List['AbstractFilter']) -> 'Contact':
+        """
+        Run a contact through an already-selected list of filters.
+        
+        Args:
+            contact: Contact to process
+            context: Execution context
+            filters: Filters to run, in priority order
+            
+        Returns:
+            Processed contact
+        """
+        for filter in filters:
+            try:
+                self.logger.debug("Running filter: %s", filter.name)
+                contact = filter.execute(contact, context)
+            except Exception as e:
+                filter.on_error(contact, e)
+                self.logger.error("%s failed: %s", filter.name, e)
+        return contact
 
 
 # Standard pipeline instances
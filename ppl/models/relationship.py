@@ -7,6 +7,9 @@ from typing import List, Dict, Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from .contact import Contact, Related
 
+# RELATED types that imply a direction between the two contacts
+_DIRECTIONAL_TYPES = frozenset({'child', 'parent', 'sibling', 'spouse', 'muse', 'crush', 'date', 'sweetheart'})
+
 
 @dataclass
 class Relationship:
@@ -51,8 +54,7 @@ class Relationship:
             Relationship object
         """
         # Determine if relationship is directional based on types
-        directional_types = {'child', 'parent', 'sibling', 'spouse', 'muse', 'crush', 'date', 'sweetheart'}
-        is_directional = any(t in directional_types for t in related.type)
+        is_directional = not _DIRECTIONAL_TYPES.isdisjoint(related.type)
         
         return Relationship(
             source=source,
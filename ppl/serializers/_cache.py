@@ -0,0 +1,110 @@
+"""
+Memoization and interning helpers for Contact serializers.
+"""
+import contextlib
+import functools
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from ..models import Contact
+
+T = TypeVar('T')
+
+# Memoized serializers only cache while a contact_cache() is open in the
+# calling thread; each thread has its own scope depth and caches
+_local = threading.local()
+
+
+def _thread_caches() -> Dict[Callable, Dict]:
+    """
+    Get the memoization caches of the calling thread.
+    
+    Returns:
+        Dict mapping each memoized serializer to its cache
+    """
+    caches = getattr(_local, 'caches', None)
+    if caches is None:
+        caches = _local.caches = {}
+    return caches
+
+
+@contextlib.contextmanager
+def contact_cache() -> Iterator[None]:
+    """
+    Enable memoized serializers for the duration of a block.
+    
+    Within the block, serializing the same Contact object again in the same
+    thread returns the cached output, so contacts must not be modified while
+    it is open. Other threads are unaffected. All cached output is released
+    when the thread's outermost block exits.
+    
+    Yields:
+        None
+    """
+    _local.depth = getattr(_local, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+        if not _local.depth:
+            _thread_caches().clear()
+
+
+def memoize_contact(maxsize: int = 1024) -> Callable[[Callable[[Contact], T]], Callable[[Contact], T]]:
+    """
+    Cache a serializer's output per Contact object inside contact_cache().
+    
+    Outside a contact_cache() block the serializer runs uncached. Inside,
+    results are cached for the calling thread and keyed on the contact's
+    identity; the entry holds the contact itself, so its id cannot be
+    reused by another object while cached. The oldest entry is evicted
+    once maxsize is reached.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        
+    Returns:
+        Decorator for functions taking a single Contact
+    """
+    def decorator(func: Callable[[Contact], T]) -> Callable[[Contact], T]:
+        @functools.wraps(func)
+        def wrapper(contact: Contact) -> T:
+            if not getattr(_local, 'depth', 0):
+                return func(contact)
+            
+            cache: Dict[int, Tuple[Contact, T]] = _thread_caches().setdefault(wrapper, {})
+            entry = cache.get(id(contact))
+            if entry is not None and entry[0] is contact:
+                return entry[1]
+            
+            result = func(contact)
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[id(contact)] = (contact, result)
+            return result
+        
+        def cache_clear() -> None:
+            _thread_caches().pop(wrapper, None)
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+def intern_strings(values: Iterable[Any]) -> List[Any]:
+    """
+    Intern parsed strings that repeat across many contacts.
+    
+    RELATED types come from a small vocabulary, so interning lets every
+    parsed contact share one string object per label. Non-string values
+    are passed through unchanged.
+    
+    Args:
+        values: Parsed values, typically RELATED types
+        
+    Returns:
+        List of the values with strings interned
+    """
+    return [sys.intern(v) if type(v) is str else v for v in values]
@@ -0,0 +1,49 @@
+"""
+File helpers shared by the contact serializers.
+"""
+import os
+from pathlib import Path
+
+
+def read_file(file_path) -> str:
+    """
+    Read a UTF-8 contact file in a single call.
+    
+    The bytes are decoded directly, skipping the newline translation of
+    text mode, so line endings are returned as stored.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        File contents
+    """
+    return Path(file_path).read_bytes().decode('utf-8')
+
+
+def write_file(file_path, content: str) -> None:
+    """
+    Write serialized contact data to a file as UTF-8.
+    
+    Args:
+        file_path: Destination path; its folder must already exist
+        content: Serialized contact data
+    """
+    Path(file_path).write_bytes(content.encode('utf-8'))
+
+
+def filename_key(filename: str) -> str:
+    """
+    Normalize a filename so that names of the same file compare equal.
+    
+    Case is folded even on case-sensitive filesystems. Names that differ
+    only in case are then treated as one file, which errs on the side of
+    checking the file on disk.
+    
+    Args:
+        filename: Name of a file in a folder
+        
+    Returns:
+        Comparison key for the filename
+    """
+    return os.path.normcase(filename).casefold()
@@ -0,0 +1,45 @@
+"""
+Worker pool helper for bulk serializer operations.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Below this many items a pool costs more to start than it saves
+_MIN_POOL_ITEMS = 8
+
+# Items sent to a worker process per round trip
+_PROCESS_CHUNKSIZE = 16
+
+
+def map_workers(func: Callable[[T], R], items: Iterable[T], workers: Optional[int] = 1,
+                processes: bool = False) -> List[R]:
+    """
+    Apply a function to each item, optionally on a worker pool.
+    
+    File reads and writes release the GIL, so threads overlap the I/O of
+    bulk imports and exports. Parsing holds the GIL, so CPU-bound imports
+    scale across cores only with processes; func and the items must then
+    be picklable. Results are returned in the order of items.
+    
+    Args:
+        func: Function to apply
+        items: Items to process
+        workers: Number of workers; 1 runs inline, None lets the executor choose
+        processes: If True, use worker processes instead of threads
+    
+    Returns:
+        List of results
+    """
+    items = list(items)
+    if workers == 1 or len(items) < _MIN_POOL_ITEMS:
+        return [func(item) for item in items]
+    
+    if processes:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items, chunksize=_PROCESS_CHUNKSIZE))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -3,15 +3,26 @@ Markdown serializer for Contact objects with YAML front matter.
 """
 import re
 import os
+import functools
 import yaml
 import marko
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
 from ..models import Contact, Related, Relationship, ContactGraph
-from .yaml_serializer import _contact_to_dict, _dict_to_contact
+from .yaml_serializer import _contact_to_dict, _dict_to_contact, _SafeDumper, _SafeLoader
+from ._cache import contact_cache, intern_strings, memoize_contact
+from ._io import filename_key, read_file, write_file
+from ._parallel import map_workers
 
+# YAML front matter between --- delimiters at the start of the document
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
 
+# Wiki-style link [[Name]] in a relationship list item
+_WIKI_LINK_RE = re.compile(r'\[\[(.+?)\]\]')
+
+
+@memoize_contact()
 def to_markdown(contact: Contact) -> str:
     """
     Render Contact to Markdown with YAML front matter.
@@ -26,17 +37,17 @@ def to_markdown(contact: Contact) -> str:
     front_matter = render_yaml_front_matter(contact)
     
     # Render main content
-    content = f"# {contact.fn}\n\n"
+    parts = [front_matter, "\n", f"# {contact.fn}\n\n"]
     
     # Add note if present
     if contact.note:
-        content += f"{contact.note}\n\n"
+        parts.append(f"{contact.note}\n\n")
     
     # Render relationships
     if contact.related:
-        content += render_related_section(contact.related)
+        parts.append(render_related_section(contact.related))
     
-    return f"{front_matter}\n{content}"
+    return ''.join(parts)
 
 
 def from_markdown(markdown_str: str, folder_path: Optional[str] = None) -> Contact:
@@ -50,15 +61,18 @@ def from_markdown(markdown_str: str, folder_path: Optional[str] = None) -> Conta
     Returns:
         Contact object
     """
-    # Parse YAML front matter
-    front_matter_dict = parse_yaml_front_matter(markdown_str)
+    # Split front matter from body with a single regex match
+    match = _FRONT_MATTER_RE.match(markdown_str)
+    if match:
+        front_matter_dict = _load_front_matter(match.group(1))
+        body = markdown_str[match.end():].strip()
+    else:
+        front_matter_dict = {}
+        body = markdown_str.strip()
     
     # Create contact from front matter
     contact = _dict_to_contact(front_matter_dict)
     
-    # Parse markdown body
-    body = _extract_markdown_body(markdown_str)
-    
     # Parse related section
     relationships = parse_related_section(body, folder_path)
     
@@ -86,7 +100,7 @@ def render_yaml_front_matter(contact: Contact) -> str:
         YAML front matter string with delimiters
     """
     contact_dict = _contact_to_dict(contact)
-    yaml_str = yaml.dump(contact_dict, default_flow_style=False, allow_unicode=True)
+    yaml_str = yaml.dump(contact_dict, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True)
     return f"---\n{yaml_str}---"
 
 
@@ -100,13 +114,49 @@ def parse_yaml_front_matter(markdown_str: str) -> Dict[str, Any]:
     Returns:
         Dictionary of front matter data
     """
-    # Match YAML front matter between --- delimiters
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, markdown_str, re.DOTALL)
+    match = _FRONT_MATTER_RE.match(markdown_str)
     
     if match:
-        yaml_str = match.group(1)
-        return yaml.safe_load(yaml_str)
+        return _load_front_matter(match.group(1))
+    
+    return {}
+
+
+def _load_front_matter(yaml_str: str) -> Dict[str, Any]:
+    """
+    Load the YAML inside a front matter block.
+    
+    Args:
+        yaml_str: YAML text between the --- delimiters
+        
+    Returns:
+        Dictionary of front matter data
+    """
+    return yaml.load(yaml_str, Loader=_SafeLoader)
+
+
+def _read_front_matter(file_path) -> Dict[str, Any]:
+    """
+    Read only the front matter of a markdown file.
+    
+    Reading stops at the closing --- fence, so the body is never loaded.
+    
+    Args:
+        file_path: Path to the .md file
+        
+    Returns:
+        Dictionary of front matter data, empty if the file has none
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return {}
+        
+        lines = []
+        for line in f:
+            if line.rstrip() == '---':
+                # Match the text the front matter pattern captures
+                return _load_front_matter(''.join(lines)[:-1])
+            lines.append(line)
     
     return {}
 
@@ -122,8 +172,8 @@ def _extract_markdown_body(markdown_str: str) -> str:
         Body content without front matter
     """
     # Remove YAML front matter
-    pattern = r'^---\s*\n.*?\n---\s*\n'
-    body = re.sub(pattern, '', markdown_str, count=1, flags=re.DOTALL)
+    match = _FRONT_MATTER_RE.match(markdown_str)
+    body = markdown_str[match.end():] if match else markdown_str
     return body.strip()
 
 
@@ -177,6 +227,10 @@ def parse_related_section(markdown_str: str, folder_path: Optional[str] = None)
     """
     relationships = []
     
+    # Without the heading text there is no section, so skip the full parse
+    if 'related' not in markdown_str.lower():
+        return relationships
+    
     # Parse markdown
     doc = marko.parse(markdown_str)
     
@@ -250,7 +304,7 @@ def _parse_relationship_item(item_text: str, folder_path: Optional[str] = None)
     if len(parts) < 2:
         return None
     
-    rel_types = parts[0].split(',')
+    rel_types = intern_strings(parts[0].split(','))
     target = parts[1].strip()
     
     rel = {
@@ -260,7 +314,7 @@ def _parse_relationship_item(item_text: str, folder_path: Optional[str] = None)
     }
     
     # Check for wiki-style link [[Name]]
-    wiki_match = re.search(r'\[\[(.+?)\]\]', target)
+    wiki_match = _WIKI_LINK_RE.search(target)
     if wiki_match:
         name = wiki_match.group(1)
         
@@ -288,6 +342,27 @@ def _parse_relationship_item(item_text: str, folder_path: Optional[str] = None)
     return rel
 
 
+def _markdown_paths(folder_path: str) -> Iterator[str]:
+    """
+    Yield paths of .md files in a folder with a single directory scan.
+    
+    Args:
+        folder_path: Path to folder containing .md files
+        
+    Yields:
+        Path of each .md file
+    """
+    try:
+        entries = os.scandir(folder_path)
+    except FileNotFoundError:
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.md') and entry.is_file():
+                yield entry.path
+
+
 def resolve_wiki_link(link_text: str, folder_path: str) -> Optional[Contact]:
     """
     Resolve wiki-style link to a Contact.
@@ -312,55 +387,63 @@ def resolve_wiki_link(link_text: str, folder_path: str) -> Optional[Contact]:
     
     if file_path.exists():
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            return from_markdown(md_content, folder_path)
+            return from_markdown(read_file(file_path), folder_path)
         except Exception:
             pass
     
     # Search all markdown files for matching FN
-    for md_file in folder.glob('*.md'):
+    for md_file in _markdown_paths(folder_path):
         try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            
-            # Parse front matter to check FN
-            front_matter = parse_yaml_front_matter(md_content)
+            # Check FN without reading the body
+            front_matter = _read_front_matter(md_file)
             if front_matter.get('FN') == link_text:
-                return from_markdown(md_content, folder_path)
+                return from_markdown(read_file(md_file), folder_path)
         except Exception:
             continue
     
     return None
 
 
-def bulk_import_markdown(folder_path: str) -> List[Contact]:
+def _load_markdown(md_file: str, folder_path: str, body: bool = True) -> Optional[Contact]:
+    """
+    Import a markdown file, warning instead of raising on failure.
+    
+    Args:
+        md_file: Path to the .md file
+        folder_path: Folder used to resolve wiki links
+        body: If False, read only the front matter and skip the body
+        
+    Returns:
+        Contact object, or None if the file could not be imported
+    """
+    try:
+        if not body:
+            return _dict_to_contact(_read_front_matter(md_file))
+        
+        return from_markdown(read_file(md_file), folder_path)
+    except Exception as e:
+        print(f"Warning: Failed to import {md_file}: {e}")
+        return None
+
+
+def bulk_import_markdown(folder_path: str, workers: Optional[int] = 1,
+                         processes: bool = False, body: bool = True) -> List[Contact]:
     """
     Import all markdown files from a folder.
     
     Args:
         folder_path: Path to folder containing .md files
+        workers: Number of workers reading files; 1 imports sequentially
+        processes: If True, parse files in worker processes instead of threads
+        body: If False, read only the front matter of each file, so
+            links listed only in the Related section are not imported
         
     Returns:
         List of Contact objects
     """
-    contacts = []
-    folder = Path(folder_path)
-    
-    if not folder.exists():
-        return contacts
-    
-    for md_file in folder.glob('*.md'):
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            
-            contact = from_markdown(md_content, folder_path)
-            contacts.append(contact)
-        except Exception as e:
-            print(f"Warning: Failed to import {md_file}: {e}")
-    
-    return contacts
+    load = functools.partial(_load_markdown, folder_path=folder_path, body=body)
+    results = map_workers(load, _markdown_paths(folder_path), workers, processes)
+    return [contact for contact in results if contact is not None]
 
 
 def should_export_markdown(contact: Contact, file_path: str, folder_path: Optional[str] = None) -> bool:
@@ -389,8 +472,7 @@ def should_export_markdown(contact: Contact, file_path: str, folder_path: Option
     
     try:
         # Load existing contact from file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            existing_md = f.read()
+        existing_md = read_file(file_path)
         
         existing_contact = from_markdown(existing_md, folder_path or os.path.dirname(file_path))
         
@@ -416,7 +498,8 @@ def should_export_markdown(contact: Contact, file_path: str, folder_path: Option
         return True
 
 
-def bulk_export_markdown(contacts: List[Contact], folder_path: str, force: bool = False) -> Tuple[int, int]:
+def bulk_export_markdown(contacts: List[Contact], folder_path: str, force: bool = False,
+                         workers: Optional[int] = 1) -> Tuple[int, int]:
     """
     Export multiple contacts to markdown files.
     Only writes files when data has changed unless force=True.
@@ -425,6 +508,7 @@ def bulk_export_markdown(contacts: List[Contact], folder_path: str, force: bool
         contacts: List of contacts to export
         folder_path: Path to folder where .md files will be written
         force: If True, write all files regardless of changes
+        workers: Number of threads writing files; 1 exports sequentially
         
     Returns:
         Tuple of (files_written, files_skipped)
@@ -432,22 +516,36 @@ def bulk_export_markdown(contacts: List[Contact], folder_path: str, force: bool
     folder = Path(folder_path)
     folder.mkdir(parents=True, exist_ok=True)
     
-    written = 0
-    skipped = 0
+    # List the folder once so new files skip the per-file existence check;
+    # names are compared by filename_key to match case-insensitive filesystems
+    existing = {filename_key(name) for name in os.listdir(folder)}
     
+    # Contacts whose filenames may name the same file are handled by one
+    # worker, in order
+    by_filename = {}
     for contact in contacts:
         # Use FN as filename, sanitized
         filename = contact.fn.replace('/', '_').replace('\\', '_') + '.md'
-        file_path = folder / filename
+        by_filename.setdefault(filename_key(filename), []).append((filename, contact))
+    
+    def export(group: List[Tuple[str, Contact]]) -> Tuple[int, int]:
+        written = 0
+        skipped = 0
         
-        if force or should_export_markdown(contact, str(file_path), folder_path):
-            md_content = to_markdown(contact)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
-            
-            written += 1
-        else:
-            skipped += 1
+        # Changed-content checks and writes render each contact once
+        with contact_cache():
+            for filename, contact in group:
+                file_path = folder / filename
+                key = filename_key(filename)
+                if (force or key not in existing
+                        or should_export_markdown(contact, str(file_path), folder_path)):
+                    write_file(file_path, to_markdown(contact))
+                    existing.add(key)
+                    written += 1
+                else:
+                    skipped += 1
+        
+        return (written, skipped)
     
-    return (written, skipped)
+    results = map_workers(export, by_filename.values(), workers)
+    return (sum(r[0] for r in results), sum(r[1] for r in results))
@@ -4,12 +4,16 @@ vCard serializer for importing and exporting Contact objects.
 import os
 import vobject
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from ..models import Contact, Related, Relationship, ContactGraph
+from ._cache import contact_cache, intern_strings, memoize_contact
+from ._io import filename_key, read_file, write_file
+from ._parallel import map_workers
 
 
+@memoize_contact()
 def to_vcard(contact: Contact) -> str:
     """
     Serialize a Contact to vCard 4.0 format.
@@ -149,20 +153,24 @@ def from_vcard(vcard_str: str) -> Contact:
     """
     vcard = vobject.readOne(vcard_str)
     
+    # Look properties up in the parsed content lines directly; attribute
+    # access on the component raises and catches for every missing property
+    props = vcard.contents
+    
     # Extract FN (required)
-    fn = vcard.fn.value if hasattr(vcard, 'fn') else ""
+    fn = props['fn'][0].value if 'fn' in props else ""
     
     # Create contact with basic fields
     contact = Contact(fn=fn)
     
     # UID
-    if hasattr(vcard, 'uid'):
-        contact.uid = vcard.uid.value
+    if 'uid' in props:
+        contact.uid = props['uid'][0].value
     
     # N (Structured Name)
-    if hasattr(vcard, 'n'):
+    if 'n' in props:
         # Handle both string and Name object
-        n_value = vcard.n.value
+        n_value = props['n'][0].value
         if isinstance(n_value, str):
             contact.n = n_value
         else:
@@ -170,8 +178,8 @@ def from_vcard(vcard_str: str) -> Contact:
             contact.n = str(n_value)
     
     # REV
-    if hasattr(vcard, 'rev'):
-        rev_value = vcard.rev.value
+    if 'rev' in props:
+        rev_value = props['rev'][0].value
         if isinstance(rev_value, str):
             try:
                 contact.rev = datetime.fromisoformat(rev_value.replace('Z', '+00:00'))
@@ -181,82 +189,68 @@ def from_vcard(vcard_str: str) -> Contact:
             contact.rev = rev_value
     
     # Email addresses
-    if hasattr(vcard, 'email_list'):
-        contact.email = [email.value for email in vcard.email_list]
-    elif hasattr(vcard, 'email'):
-        contact.email = [vcard.email.value]
+    if 'email' in props:
+        contact.email = [email.value for email in props['email']]
     
     # Phone numbers
-    if hasattr(vcard, 'tel_list'):
-        contact.tel = [tel.value for tel in vcard.tel_list]
-    elif hasattr(vcard, 'tel'):
-        contact.tel = [vcard.tel.value]
+    if 'tel' in props:
+        contact.tel = [tel.value for tel in props['tel']]
     
     # Addresses
-    if hasattr(vcard, 'adr_list'):
-        contact.adr = [str(adr.value) for adr in vcard.adr_list]
-    elif hasattr(vcard, 'adr'):
-        contact.adr = [str(vcard.adr.value)]
+    if 'adr' in props:
+        contact.adr = [str(adr.value) for adr in props['adr']]
     
     # Organization
-    if hasattr(vcard, 'org_list'):
-        contact.org = [str(org.value) for org in vcard.org_list]
-    elif hasattr(vcard, 'org'):
-        contact.org = [str(vcard.org.value)]
+    if 'org' in props:
+        contact.org = [str(org.value) for org in props['org']]
     
     # Title
-    if hasattr(vcard, 'title'):
-        contact.title = vcard.title.value
+    if 'title' in props:
+        contact.title = props['title'][0].value
     
     # Role
-    if hasattr(vcard, 'role'):
-        contact.role = vcard.role.value
+    if 'role' in props:
+        contact.role = props['role'][0].value
     
     # Note
-    if hasattr(vcard, 'note'):
-        contact.note = vcard.note.value
+    if 'note' in props:
+        contact.note = props['note'][0].value
     
     # Categories
-    if hasattr(vcard, 'categories_list'):
-        contact.categories = [cat.value for cat in vcard.categories_list]
-    elif hasattr(vcard, 'categories'):
-        contact.categories = [vcard.categories.value]
+    if 'categories' in props:
+        contact.categories = [cat.value for cat in props['categories']]
     
     # URLs
-    if hasattr(vcard, 'url_list'):
-        contact.url = [url.value for url in vcard.url_list]
-    elif hasattr(vcard, 'url'):
-        contact.url = [vcard.url.value]
+    if 'url' in props:
+        contact.url = [url.value for url in props['url']]
     
     # Nickname
-    if hasattr(vcard, 'nickname_list'):
-        contact.nickname = [nick.value for nick in vcard.nickname_list]
-    elif hasattr(vcard, 'nickname'):
-        contact.nickname = [vcard.nickname.value]
+    if 'nickname' in props:
+        contact.nickname = [nick.value for nick in props['nickname']]
     
     # Birthday
-    if hasattr(vcard, 'bday'):
-        contact.bday = str(vcard.bday.value)
+    if 'bday' in props:
+        contact.bday = str(props['bday'][0].value)
     
     # Anniversary
-    if hasattr(vcard, 'anniversary'):
-        contact.anniversary = str(vcard.anniversary.value)
+    if 'anniversary' in props:
+        contact.anniversary = str(props['anniversary'][0].value)
     
     # Gender
-    if hasattr(vcard, 'gender'):
-        contact.gender = vcard.gender.value
+    if 'gender' in props:
+        contact.gender = props['gender'][0].value
     
     # Photo
-    if hasattr(vcard, 'photo'):
-        contact.photo = vcard.photo.value
+    if 'photo' in props:
+        contact.photo = props['photo'][0].value
     
     # Time zone
-    if hasattr(vcard, 'tz'):
-        contact.tz = vcard.tz.value
+    if 'tz' in props:
+        contact.tz = props['tz'][0].value
     
     # Geographic position
-    if hasattr(vcard, 'geo'):
-        geo_value = vcard.geo.value
+    if 'geo' in props:
+        geo_value = props['geo'][0].value
         if isinstance(geo_value, str) and geo_value.startswith('geo:'):
             parts = geo_value[4:].split(',')
             if len(parts) == 2:
@@ -266,32 +260,17 @@ def from_vcard(vcard_str: str) -> Contact:
                     pass
     
     # Related contacts
-    if hasattr(vcard, 'related_list'):
-        for rel in vcard.related_list:
-            related = Related(uri=rel.value)
-            if hasattr(rel, 'type_param'):
-                type_value = rel.type_param
-                if isinstance(type_value, str):
-                    related.type = [t.strip() for t in type_value.split(',')]
-                elif isinstance(type_value, list):
-                    related.type = type_value
-            if hasattr(rel, 'pref_param'):
-                try:
-                    related.pref = int(rel.pref_param)
-                except (ValueError, TypeError):
-                    pass
-            contact.related.append(related)
-    elif hasattr(vcard, 'related'):
-        related = Related(uri=vcard.related.value)
-        if hasattr(vcard.related, 'type_param'):
-            type_value = vcard.related.type_param
+    for rel in props.get('related', ()):
+        related = Related(uri=rel.value)
+        if hasattr(rel, 'type_param'):
+            type_value = rel.type_param
             if isinstance(type_value, str):
-                related.type = [t.strip() for t in type_value.split(',')]
+                related.type = intern_strings(t.strip() for t in type_value.split(','))
             elif isinstance(type_value, list):
-                related.type = type_value
-        if hasattr(vcard.related, 'pref_param'):
+                related.type = intern_strings(type_value)
+        if hasattr(rel, 'pref_param'):
             try:
-                related.pref = int(vcard.related.pref_param)
+                related.pref = int(rel.pref_param)
             except (ValueError, TypeError):
                 pass
         contact.related.append(related)
@@ -309,10 +288,7 @@ def import_vcard(file_path: str) -> Contact:
     Returns:
         Contact object
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        vcard_str = f.read()
-    
-    return from_vcard(vcard_str)
+    return from_vcard(read_file(file_path))
 
 
 def export_vcard(contact: Contact, file_path: str) -> None:
@@ -328,37 +304,87 @@ def export_vcard(contact: Contact, file_path: str) -> None:
     # Ensure directory exists
     os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(vcard_str)
+    write_file(file_path, vcard_str)
 
 
-def bulk_import(folder_path: str) -> List[Contact]:
+def _vcard_paths(folder_path: str) -> Iterator[str]:
     """
-    Import all vCard files from a folder.
+    Yield paths of .vcf files in a folder with a single directory scan.
     
     Args:
         folder_path: Path to folder containing .vcf files
         
+    Yields:
+        Path of each .vcf file
+    """
+    try:
+        entries = os.scandir(folder_path)
+    except FileNotFoundError:
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.vcf') and entry.is_file():
+                yield entry.path
+
+
+def _load_vcard(file_path: str) -> Optional[Contact]:
+    """
+    Import a vCard file, warning instead of raising on failure.
+    
+    Args:
+        file_path: Path to the .vcf file
+        
     Returns:
-        List of Contact objects
+        Contact object, or None if the file could not be imported
     """
-    contacts = []
-    folder = Path(folder_path)
+    try:
+        return import_vcard(file_path)
+    except Exception as e:
+        print(f"Warning: Failed to import {file_path}: {e}")
+        return None
+
+
+def iter_vcards(folder_path: str) -> Iterator[Contact]:
+    """
+    Lazily import the vCard files in a folder.
+    
+    Files that fail to import are reported and skipped.
     
-    if not folder.exists():
-        return contacts
+    Args:
+        folder_path: Path to folder containing .vcf files
+        
+    Yields:
+        Contact for each .vcf file
+    """
+    for file_path in _vcard_paths(folder_path):
+        contact = _load_vcard(file_path)
+        if contact is not None:
+            yield contact
+
+
+def bulk_import(folder_path: str, workers: Optional[int] = 1,
+                processes: bool = False) -> List[Contact]:
+    """
+    Import all vCard files from a folder.
     
-    for vcf_file in folder.glob('*.vcf'):
-        try:
-            contact = import_vcard(str(vcf_file))
-            contacts.append(contact)
-        except Exception as e:
-            print(f"Warning: Failed to import {vcf_file}: {e}")
+    Args:
+        folder_path: Path to folder containing .vcf files
+        workers: Number of workers reading files; 1 imports sequentially
+        processes: If True, parse files in worker processes instead of threads
+        
+    Returns:
+        List of Contact objects
+    """
+    if workers == 1:
+        return list(iter_vcards(folder_path))
     
-    return contacts
+    results = map_workers(_load_vcard, _vcard_paths(folder_path), workers, processes)
+    return [contact for contact in results if contact is not None]
 
 
-def bulk_export(contacts: List[Contact], folder_path: str, force: bool = False) -> Tuple[int, int]:
+def bulk_export(contacts: List[Contact], folder_path: str, force: bool = False,
+                workers: Optional[int] = 1) -> Tuple[int, int]:
     """
     Export multiple contacts to vCard files in a folder.
     Only writes files when data has changed unless force=True.
@@ -367,6 +393,7 @@ def bulk_export(contacts: List[Contact], folder_path: str, force: bool = False)
         contacts: List of contacts to export
         folder_path: Path to folder where .vcf files will be written
         force: If True, write all files regardless of changes
+        workers: Number of threads writing files; 1 exports sequentially
         
     Returns:
         Tuple of (files_written, files_skipped)
@@ -374,21 +401,39 @@ def bulk_export(contacts: List[Contact], folder_path: str, force: bool = False)
     folder = Path(folder_path)
     folder.mkdir(parents=True, exist_ok=True)
     
-    written = 0
-    skipped = 0
+    # List the folder once so new files skip the per-file existence check;
+    # names are compared by filename_key to match case-insensitive filesystems
+    existing = {filename_key(name) for name in os.listdir(folder)}
     
+    # Contacts whose filenames may name the same file are handled by one
+    # worker, in order
+    by_filename = {}
     for contact in contacts:
         # Use FN as filename, sanitized
         filename = contact.fn.replace('/', '_').replace('\\', '_') + '.vcf'
-        file_path = folder / filename
+        by_filename.setdefault(filename_key(filename), []).append((filename, contact))
+    
+    def export(group: List[Tuple[str, Contact]]) -> Tuple[int, int]:
+        written = 0
+        skipped = 0
         
-        if force or should_export_vcard(contact, str(file_path)):
-            export_vcard(contact, str(file_path))
-            written += 1
-        else:
-            skipped += 1
+        # Changed-content checks and writes render each contact once
+        with contact_cache():
+            for filename, contact in group:
+                file_path = folder / filename
+                key = filename_key(filename)
+                if force or key not in existing or should_export_vcard(contact, str(file_path)):
+                    # Folder was created above, so write directly
+                    write_file(file_path, to_vcard(contact))
+                    existing.add(key)
+                    written += 1
+                else:
+                    skipped += 1
+        
+        return (written, skipped)
     
-    return (written, skipped)
+    results = map_workers(export, by_filename.values(), workers)
+    return (sum(r[0] for r in results), sum(r[1] for r in results))
 
 
 def extract_relationships(contact: Contact) -> List[Relationship]:
@@ -401,13 +446,7 @@ def extract_relationships(contact: Contact) -> List[Relationship]:
     Returns:
         List of Relationship objects (targets may be None if not resolved)
     """
-    relationships = []
-    
-    for related in contact.related:
-        rel = Relationship.from_vcard_related(contact, related)
-        relationships.append(rel)
-    
-    return relationships
+    return [Relationship.from_vcard_related(contact, related) for related in contact.related]
 
 
 def inject_relationships(contact: Contact, relationships: List[Relationship]) -> Contact:
@@ -442,6 +481,10 @@ def compare_rev(contact1: Contact, contact2: Contact) -> bool:
     Returns:
         True if contact1 is newer or equal, False otherwise
     """
+    # A contact is always as new as itself
+    if contact1 is contact2:
+        return True
+    
     return contact1.compare_rev(contact2) >= 0
 
 
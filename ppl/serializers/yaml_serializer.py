@@ -6,8 +6,16 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..models import Contact, Related
+from ._cache import intern_strings, memoize_contact
 
+# Prefer the libyaml-backed dumper and loader when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
 
+
+@memoize_contact()
 def to_yaml(contact: Contact) -> str:
     """
     Serialize a Contact to YAML format.
@@ -19,7 +27,7 @@ def to_yaml(contact: Contact) -> str:
         String containing YAML representation
     """
     data = _contact_to_dict(contact)
-    return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True)
 
 
 def from_yaml(yaml_str: str) -> Contact:
@@ -32,7 +40,7 @@ def from_yaml(yaml_str: str) -> Contact:
     Returns:
         Contact object
     """
-    data = yaml.safe_load(yaml_str)
+    data = yaml.load(yaml_str, Loader=_SafeLoader)
     return _dict_to_contact(data)
 
 
@@ -50,7 +58,7 @@ def to_flat_yaml(contact: Contact) -> str:
         String containing flat YAML representation
     """
     flat_data = _flatten_dict(_contact_to_dict(contact))
-    return yaml.dump(flat_data, default_flow_style=False, allow_unicode=True)
+    return yaml.dump(flat_data, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True)
 
 
 def from_flat_yaml(yaml_str: str) -> Contact:
@@ -63,7 +71,7 @@ def from_flat_yaml(yaml_str: str) -> Contact:
     Returns:
         Contact object
     """
-    flat_data = yaml.safe_load(yaml_str)
+    flat_data = yaml.load(yaml_str, Loader=_SafeLoader)
     data = _unflatten_dict(flat_data)
     return _dict_to_contact(data)
 
@@ -251,9 +259,12 @@ def _dict_to_contact(data: Dict[str, Any]) -> Contact:
     if 'RELATED' in data:
         for rel_data in data['RELATED']:
             if isinstance(rel_data, dict):
+                rel_types = rel_data.get('type', [])
+                if isinstance(rel_types, list):
+                    rel_types = intern_strings(rel_types)
                 related = Related(
                     uri=rel_data.get('uri', ''),
-                    type=rel_data.get('type', []),
+                    type=rel_types,
                     text_value=rel_data.get('text_value'),
                     pref=rel_data.get('pref')
                 )
@@ -266,34 +277,41 @@ def _flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Di
     """
     Flatten a nested dictionary.
     
+    Nested dictionaries, and lists held by a dictionary, are walked with an
+    explicit stack rather than recursion. Lists nested directly in lists are
+    kept as values.
+    
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key for recursion
+        parent_key: Prefix for the flattened keys
         sep: Separator for nested keys
         
     Returns:
         Flattened dictionary
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    items.extend(_flatten_dict(item, f"{new_key}.{i}", sep=sep).items())
-                else:
-                    items.append((f"{new_key}.{i}", item))
+    flat = {}
+    # Entries are (key, value, whether value is held by a dict)
+    stack = [(parent_key, d, True)]
+    while stack:
+        key, value, in_dict = stack.pop()
+        if isinstance(value, dict):
+            children = [(f"{key}{sep}{k}" if key else k, v, True) for k, v in value.items()]
+        elif in_dict and isinstance(value, list):
+            children = [(f"{key}.{i}", item, False) for i, item in enumerate(value)]
         else:
-            items.append((new_key, v))
-    return dict(items)
+            flat[key] = value
+            continue
+        # Push in reverse so keys come out in document order
+        stack.extend(reversed(children))
+    return flat
 
 
 def _unflatten_dict(d: Dict[str, Any], sep: str = '.') -> Dict[str, Any]:
     """
     Unflatten a flattened dictionary.
     
+    A key part followed by a numeric part becomes a list.
+    
     Args:
         d: Flattened dictionary
         sep: Separator used for nested keys
@@ -304,42 +322,37 @@ def _unflatten_dict(d: Dict[str, Any], sep: str = '.') -> Dict[str, Any]:
     result = {}
     for key, value in d.items():
         parts = key.split(sep)
-        current = result
-        for i, part in enumerate(parts[:-1]):
-            # Check if this part is a list index
-            if part.isdigit() or (i > 0 and parts[i-1].isdigit()):
-                # Handle list creation
-                if not isinstance(current, list):
-                    parent_key = parts[i-1] if i > 0 else ''
-                    if parent_key and parent_key not in result:
-                        result[parent_key] = []
-                    current = result.get(parent_key, [])
-                continue
-            
-            if part not in current:
-                # Look ahead to see if next part is a digit (indicating a list)
-                if i + 1 < len(parts) and parts[i + 1].isdigit():
-                    current[part] = []
-                else:
-                    current[part] = {}
-            current = current[part]
+        node = result
+        for part, next_part in zip(parts, parts[1:]):
+            node = _child(node, part, [] if next_part.isdigit() else {})
         
-        # Set the final value
-        final_key = parts[-1]
-        if final_key.isdigit():
-            # This is a list item
-            idx = int(final_key)
-            parent_parts = parts[:-1]
-            parent = result
-            for p in parent_parts:
-                if p in parent:
-                    parent = parent[p]
-            if isinstance(parent, list):
-                # Extend list if needed
-                while len(parent) <= idx:
-                    parent.append(None)
-                parent[idx] = value
+        last = parts[-1]
+        if isinstance(node, list):
+            _child(node, last, None)
+            node[int(last)] = value
         else:
-            current[final_key] = value
+            node[last] = value
     
     return result
+
+
+def _child(node: Any, part: str, default: Any) -> Any:
+    """
+    Get a child of a dict or list node, creating it if missing.
+    
+    Args:
+        node: Dict, or list indexed by a numeric part
+        part: Key or list index of the child
+        default: Value to store if the child is missing
+        
+    Returns:
+        The child value
+    """
+    if isinstance(node, list):
+        idx = int(part)
+        if len(node) <= idx:
+            node.extend([None] * (idx + 1 - len(node)))
+        if node[idx] is None:
+            node[idx] = default
+        return node[idx]
+    return node.setdefault(part, default)
@@ -0,0 +1,94 @@
+"""
+Shared pytest fixtures.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# orjson decodes UTF-8 bytes directly; stdlib json accepts bytes too
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from ppl.filters import UIDFilter, GenderFilter
+from ppl.models import Contact, import_pipeline
+
+# Filters keep no per-contact state, so one instance serves every test
+UID_FILTER = UIDFilter()
+GENDER_FILTER = GenderFilter()
+
+
+def pytest_configure(config):
+    """Keep test scratch files on a RAM-backed filesystem when available."""
+    if os.environ.get("TMPDIR") or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if sys.platform.startswith("linux") and os.access("/dev/shm", os.W_OK):
+        # tmp_path and tmp_path_factory derive their root from tempfile
+        tempfile.tempdir = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide scratch directory created once and shared between tests."""
+    return tmp_path_factory.mktemp("graphml")
+
+
+@pytest.fixture
+def graph_file(shared_tmp, request):
+    """Unique GraphML file path for the current test inside shared_tmp."""
+    return str(shared_tmp / f"{request.node.name}.graphml")
+
+
+def _configure_import_pipeline(*filters):
+    """Swap import_pipeline's filters for the test and restore them afterwards."""
+    saved = list(import_pipeline.filters)
+    import_pipeline.filters[:] = sorted(filters, key=lambda f: f.priority)
+    yield import_pipeline
+    import_pipeline.filters[:] = saved
+
+
+@pytest.fixture
+def pipeline_with_uid():
+    """import_pipeline with only the UID filter registered."""
+    yield from _configure_import_pipeline(UID_FILTER)
+
+
+@pytest.fixture
+def pipeline_with_uid_gender():
+    """import_pipeline with the UID and gender filters registered."""
+    yield from _configure_import_pipeline(UID_FILTER, GENDER_FILTER)
+
+
+@pytest.fixture(scope="session")
+def load_json():
+    """Function that reads and decodes a JSON file."""
+    def load(path):
+        return _json_loads(Path(path).read_bytes())
+    return load
+
+
+@pytest.fixture(scope="session")
+def alice():
+    """Shared read-only contact; deep-copy it before mutating."""
+    return Contact(
+        fn="Alice Johnson",
+        uid="alice-uid",
+        email=["alice@example.com"],
+        tel=["+1-555-0001"],
+        title="Engineer"
+    )
+
+
+@pytest.fixture(scope="session")
+def bob():
+    """Shared read-only contact; deep-copy it before mutating."""
+    return Contact(
+        fn="Bob Smith",
+        uid="bob-uid",
+        email=["bob@example.com"],
+        title="Manager"
+    )
@@ -3,7 +3,7 @@ Unit tests for Contact model.
 """
 import pytest
 from datetime import datetime
-from ppl.models import Contact, Related
+from ppl.models import Contact, Related, index_by_fn
 
 
 class TestContact:
@@ -42,6 +42,14 @@ class TestContact:
         with pytest.raises(ValueError, match="FN .* is required"):
             Contact(fn="")
     
+    def test_index_by_fn(self):
+        """Test indexing contacts by FN keeps the first match."""
+        first = Contact(fn="Alice", uid="alice-1")
+        contacts = [first, Contact(fn="Bob"), Contact(fn="Alice", uid="alice-2")]
+        by_fn = index_by_fn(contacts)
+        assert set(by_fn) == {"Alice", "Bob"}
+        assert by_fn["Alice"] is first
+    
     def test_contact_compare_rev_both_none(self):
         """Test REV comparison when both are None."""
         c1 = Contact(fn="Contact 1")
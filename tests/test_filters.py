@@ -96,6 +96,19 @@ class TestFilterPipeline:
         # All should have UIDs assigned
         assert all(c.uid is not None for c in results)
 
+    def test_run_batch_skips_inactive_filters(self):
+        """Test that run_batch only applies filters that should run."""
+        pipeline = FilterPipeline("test")
+        pipeline.register(GenderFilter())
+        
+        contact = Contact(fn="Jane")
+        contact.related.append(Related(uri="urn:uuid:1", type=["mother"]))
+        context = FilterContext(pipeline_name="export")
+        
+        results = pipeline.run_batch([contact], context)
+        
+        assert results[0].gender is None
+
 
 class TestUIDFilter:
     """Test cases for UIDFilter."""
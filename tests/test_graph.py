@@ -1,6 +1,7 @@
 """
 Unit tests for ContactGraph.
 """
+import copy
 import pytest
 from ppl.models import Contact, ContactGraph, Relationship
 
@@ -120,6 +121,77 @@ class TestContactGraph:
         with pytest.raises(ValueError, match="not in graph"):
             graph.add_relationship(rel)
     
+    def test_add_relationships(self):
+        """Test adding a batch of relationships."""
+        graph = ContactGraph()
+        
+        alice = Contact(fn="Alice", uid="alice-uid")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        carol = Contact(fn="Carol", uid="carol-uid")
+        for contact in (alice, bob, carol):
+            graph.add_contact(contact)
+        
+        graph.add_relationships([
+            Relationship(source=alice, target=bob, types=["friend"]),
+            Relationship(source=alice, target=carol, types=["colleague"], directional=True),
+        ])
+        
+        relationships = {r.target.uid: r for r in graph.get_relationships("alice-uid")}
+        assert set(relationships) == {"bob-uid", "carol-uid"}
+        assert relationships["carol-uid"].types == ["colleague"]
+        assert relationships["carol-uid"].directional is True
+    
+    def test_add_relationships_invalid_adds_nothing(self):
+        """Test that an invalid relationship in a batch leaves the graph unchanged."""
+        graph = ContactGraph()
+        
+        alice = Contact(fn="Alice", uid="alice-uid")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        carol = Contact(fn="Carol", uid="carol-uid")
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        
+        with pytest.raises(ValueError, match="not in graph"):
+            graph.add_relationships([
+                Relationship(source=alice, target=bob, types=["friend"]),
+                Relationship(source=alice, target=carol, types=["friend"]),
+            ])
+        
+        assert graph.get_all_relationships() == []
+    
+    def test_from_contacts(self):
+        """Test building a graph from contacts and relationships in one call."""
+        alice = Contact(fn="Alice", uid="alice-uid")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        
+        graph = ContactGraph.from_contacts(
+            [alice, bob],
+            [Relationship(source=alice, target=bob, types=["friend"])]
+        )
+        
+        assert graph.get_contact("alice-uid") is alice
+        assert len(graph.get_all_contacts()) == 2
+        assert graph.get_relationships("alice-uid")[0].target == bob
+    
+    def test_from_contacts_requires_uid(self):
+        """Test that building a graph from a contact without UID raises an error."""
+        with pytest.raises(ValueError, match="UID"):
+            ContactGraph.from_contacts([Contact(fn="No UID")])
+    
+    @pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+    def test_get_contact_after_copy(self, copier):
+        """Test that a copied graph looks contacts up in its own storage."""
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Alice", uid="alice-uid"))
+        
+        graph2 = copier(graph)
+        graph2._contacts = dict(graph2._contacts)
+        graph2.add_contact(Contact(fn="Bob", uid="bob-uid"))
+        
+        assert graph2.get_contact("alice-uid").fn == "Alice"
+        assert graph2.get_contact("bob-uid").fn == "Bob"
+        assert graph.get_contact("bob-uid") is None
+    
     def test_get_relationships_empty(self):
         """Test getting relationships for a contact with none."""
         graph = ContactGraph()
@@ -1,6 +1,7 @@
 """
 Tests for ContactGraph merge functionality.
 """
+import json
 import pytest
 from datetime import datetime
 from ppl.models import Contact, ContactGraph
@@ -221,6 +222,61 @@ class TestGraphMerge:
         assert skipped == 0
         assert len(graph.get_all_contacts()) == 3
     
+    def test_merge_identical_contact_is_skipped(self):
+        """Test that merging identical data reports a skip without changes."""
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Mia", uid="mia-uid", email=["mia@example.com"]))
+        
+        modified, action = graph.merge_contact(
+            Contact(fn="Mia", uid="mia-uid", email=["mia@example.com"])
+        )
+        
+        assert modified is False
+        assert action == "skipped"
+        assert graph.get_contact("mia-uid").email == ["mia@example.com"]
+    
+    def test_merge_newer_rev_skips_equality_check(self, monkeypatch):
+        """Test that a newer REV is merged without comparing every field."""
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Mia", uid="mia-uid", rev=datetime(2024, 1, 1)))
+        
+        def fail_eq(self, other):
+            raise AssertionError("full equality check should not run")
+        
+        monkeypatch.setattr(Contact, "__eq__", fail_eq)
+        modified, action = graph.merge_contact(
+            Contact(fn="Mia", uid="mia-uid", title="CEO", rev=datetime(2024, 6, 1))
+        )
+        
+        assert (modified, action) == (True, "updated")
+        assert graph.get_contact("mia-uid").title == "CEO"
+    
+    def test_merge_contacts_batch(self):
+        """Test merging a batch returns counts of each action."""
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Kate", uid="kate-uid", rev=datetime(2024, 6, 1)))
+        
+        batch = [
+            Contact(fn="Liam", uid="liam-uid", rev=datetime(2024, 1, 1)),  # New
+            Contact(fn="Kate", uid="kate-uid", rev=datetime(2024, 1, 1)),  # Skip (older)
+            Contact(fn="Liam", uid="liam-uid", title="Updated", rev=datetime(2024, 2, 1)),  # Update
+        ]
+        
+        added, updated, skipped = graph.merge_contacts(batch)
+        
+        assert (added, updated, skipped) == (1, 1, 1)
+        assert graph.get_contact("liam-uid").title == "Updated"
+    
+    def test_merge_action_is_string(self):
+        """Test that merge actions are plain strings."""
+        graph = ContactGraph()
+        
+        _, action = graph.merge_contact(Contact(fn="Nina", uid="nina-uid"))
+        
+        assert type(action) is str
+        assert json.dumps(action) == '"added"'
+        assert action in {"added"}
+    
     def test_merge_updates_statistics(self):
         """Test that merge operations return correct statistics."""
         graph = ContactGraph()
@@ -2,7 +2,6 @@
 Tests for graph persistence functionality.
 """
 import pytest
-import tempfile
 import os
 from pathlib import Path
 
@@ -12,133 +11,121 @@ from ppl.models import Contact, ContactGraph, Relationship
 class TestGraphPersistence:
     """Test graph save and load functionality."""
     
-    def test_save_and_load_empty_graph(self):
+    def test_save_and_load_empty_graph(self, graph_file):
         """Test saving and loading an empty graph."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "empty.graphml")
-            
-            # Create and save empty graph
-            graph = ContactGraph()
-            graph.save(graph_file)
-            
-            # Load and verify
-            graph2 = ContactGraph()
-            graph2.load(graph_file)
-            
-            assert len(graph2.get_all_contacts()) == 0
+        # Create and save empty graph
+        graph = ContactGraph()
+        graph.save(graph_file)
+        
+        # Load and verify
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        assert len(graph2.get_all_contacts()) == 0
     
-    def test_save_and_load_contacts(self):
+    def test_save_and_load_contacts(self, graph_file):
         """Test saving and loading contacts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "contacts.graphml")
-            
-            # Create contacts
-            alice = Contact(fn="Alice", uid="alice-uid", email=["alice@example.com"])
-            bob = Contact(fn="Bob", uid="bob-uid", email=["bob@example.com"], tel=["+1-555-0100"])
-            
-            # Create and populate graph
-            graph = ContactGraph()
-            graph.add_contact(alice)
-            graph.add_contact(bob)
-            
-            # Save
-            graph.save(graph_file)
-            
-            # Load into new graph
-            graph2 = ContactGraph()
-            graph2.load(graph_file)
-            
-            # Verify contacts
-            assert len(graph2.get_all_contacts()) == 2
-            
-            alice2 = graph2.get_contact("alice-uid")
-            assert alice2.fn == "Alice"
-            assert alice2.email == ["alice@example.com"]
-            
-            bob2 = graph2.get_contact("bob-uid")
-            assert bob2.fn == "Bob"
-            assert bob2.tel == ["+1-555-0100"]
+        # Create contacts
+        alice = Contact(fn="Alice", uid="alice-uid", email=["alice@example.com"])
+        bob = Contact(fn="Bob", uid="bob-uid", email=["bob@example.com"], tel=["+1-555-0100"])
+        
+        # Create and populate graph
+        graph = ContactGraph()
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        
+        # Save
+        graph.save(graph_file)
+        
+        # Load into new graph
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        # Verify contacts
+        assert len(graph2.get_all_contacts()) == 2
+        
+        alice2 = graph2.get_contact("alice-uid")
+        assert alice2.fn == "Alice"
+        assert alice2.email == ["alice@example.com"]
+        
+        bob2 = graph2.get_contact("bob-uid")
+        assert bob2.fn == "Bob"
+        assert bob2.tel == ["+1-555-0100"]
     
-    def test_save_and_load_relationships(self):
+    def test_save_and_load_relationships(self, graph_file):
         """Test saving and loading relationships."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "relationships.graphml")
-            
-            # Create contacts
-            alice = Contact(fn="Alice", uid="alice-uid")
-            bob = Contact(fn="Bob", uid="bob-uid")
-            
-            # Create graph with relationship
-            graph = ContactGraph()
-            graph.add_contact(alice)
-            graph.add_contact(bob)
-            
-            rel = Relationship(source=alice, target=bob, types=["friend"])
-            graph.add_relationship(rel)
-            
-            # Save
-            graph.save(graph_file)
-            
-            # Load into new graph
-            graph2 = ContactGraph()
-            graph2.load(graph_file)
-            
-            # Verify relationships
-            alice_rels = graph2.get_relationships("alice-uid")
-            assert len(alice_rels) == 1
-            assert alice_rels[0].types == ["friend"]
-            assert alice_rels[0].target.uid == "bob-uid"
+        # Create contacts
+        alice = Contact(fn="Alice", uid="alice-uid")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        
+        # Create graph with relationship
+        graph = ContactGraph()
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        
+        rel = Relationship(source=alice, target=bob, types=["friend"])
+        graph.add_relationship(rel)
+        
+        # Save
+        graph.save(graph_file)
+        
+        # Load into new graph
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        # Verify relationships
+        alice_rels = graph2.get_relationships("alice-uid")
+        assert len(alice_rels) == 1
+        assert alice_rels[0].types == ["friend"]
+        assert alice_rels[0].target.uid == "bob-uid"
     
-    def test_save_and_load_complex_contact(self):
+    def test_save_and_load_complex_contact(self, graph_file):
         """Test saving and loading contact with all fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "complex.graphml")
-            
-            from ppl.models import Related
-            from datetime import datetime
-            
-            # Create complex contact
-            contact = Contact(
-                fn="John Doe",
-                uid="john-uid",
-                email=["john@example.com", "jdoe@work.com"],
-                tel=["+1-555-0100", "+1-555-0101"],
-                org=["Tech Corp", "Engineering"],
-                title="Software Engineer",
-                role="Developer",
-                note="Test contact",
-                categories=["work", "friend"],
-                url=["https://example.com"],
-                nickname=["Johnny"],
-                gender="M",
-                related=[Related(uri="urn:uuid:related-uid", type=["colleague"])]
-            )
-            contact.rev = datetime.now()
-            
-            # Create and save graph
-            graph = ContactGraph()
-            graph.add_contact(contact)
-            graph.save(graph_file)
-            
-            # Load and verify
-            graph2 = ContactGraph()
-            graph2.load(graph_file)
-            
-            loaded = graph2.get_contact("john-uid")
-            assert loaded.fn == "John Doe"
-            assert loaded.email == ["john@example.com", "jdoe@work.com"]
-            assert loaded.tel == ["+1-555-0100", "+1-555-0101"]
-            assert loaded.org == ["Tech Corp", "Engineering"]
-            assert loaded.title == "Software Engineer"
-            assert loaded.role == "Developer"
-            assert loaded.note == "Test contact"
-            assert loaded.categories == ["work", "friend"]
-            assert loaded.url == ["https://example.com"]
-            assert loaded.nickname == ["Johnny"]
-            assert loaded.gender == "M"
-            assert len(loaded.related) == 1
-            assert loaded.related[0].uri == "urn:uuid:related-uid"
-            assert loaded.related[0].type == ["colleague"]
+        from ppl.models import Related
+        from datetime import datetime
+        
+        # Create complex contact
+        contact = Contact(
+            fn="John Doe",
+            uid="john-uid",
+            email=["john@example.com", "jdoe@work.com"],
+            tel=["+1-555-0100", "+1-555-0101"],
+            org=["Tech Corp", "Engineering"],
+            title="Software Engineer",
+            role="Developer",
+            note="Test contact",
+            categories=["work", "friend"],
+            url=["https://example.com"],
+            nickname=["Johnny"],
+            gender="M",
+            related=[Related(uri="urn:uuid:related-uid", type=["colleague"])]
+        )
+        contact.rev = datetime.now()
+        
+        # Create and save graph
+        graph = ContactGraph()
+        graph.add_contact(contact)
+        graph.save(graph_file)
+        
+        # Load and verify
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        loaded = graph2.get_contact("john-uid")
+        assert loaded.fn == "John Doe"
+        assert loaded.email == ["john@example.com", "jdoe@work.com"]
+        assert loaded.tel == ["+1-555-0100", "+1-555-0101"]
+        assert loaded.org == ["Tech Corp", "Engineering"]
+        assert loaded.title == "Software Engineer"
+        assert loaded.role == "Developer"
+        assert loaded.note == "Test contact"
+        assert loaded.categories == ["work", "friend"]
+        assert loaded.url == ["https://example.com"]
+        assert loaded.nickname == ["Johnny"]
+        assert loaded.gender == "M"
+        assert len(loaded.related) == 1
+        assert loaded.related[0].uri == "urn:uuid:related-uid"
+        assert loaded.related[0].type == ["colleague"]
     
     def test_load_nonexistent_file(self):
         """Test loading from non-existent file raises error."""
@@ -147,73 +134,150 @@ class TestGraphPersistence:
         with pytest.raises(FileNotFoundError):
             graph.load("/nonexistent/file.graphml")
     
-    def test_save_creates_directory(self):
+    def test_save_creates_directory(self, shared_tmp, request):
         """Test that save creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "subdir", "nested", "graph.graphml")
-            
-            graph = ContactGraph()
-            contact = Contact(fn="Test", uid="test-uid")
-            graph.add_contact(contact)
-            
-            # Should create nested directories
-            graph.save(graph_file)
-            
-            assert os.path.exists(graph_file)
+        graph_file = str(shared_tmp / request.node.name / "subdir" / "nested" / "graph.graphml")
+        
+        graph = ContactGraph()
+        contact = Contact(fn="Test", uid="test-uid")
+        graph.add_contact(contact)
+        
+        # Should create nested directories
+        graph.save(graph_file)
+        
+        assert os.path.exists(graph_file)
     
-    def test_roundtrip_preserves_data(self):
+    def test_roundtrip_preserves_data(self, graph_file):
         """Test multiple save/load cycles preserve data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "roundtrip.graphml")
-            
-            # Create original graph
-            original = ContactGraph()
-            alice = Contact(fn="Alice", uid="alice-uid", email=["alice@example.com"])
-            bob = Contact(fn="Bob", uid="bob-uid", email=["bob@example.com"])
-            original.add_contact(alice)
-            original.add_contact(bob)
-            
-            # Save and load multiple times
-            for i in range(3):
-                graph = ContactGraph()
-                if i == 0:
-                    graph = original
-                else:
-                    graph.load(graph_file)
-                
-                graph.save(graph_file)
-            
-            # Final load and verify
-            final = ContactGraph()
-            final.load(graph_file)
+        # Create original graph
+        original = ContactGraph()
+        alice = Contact(fn="Alice", uid="alice-uid", email=["alice@example.com"])
+        bob = Contact(fn="Bob", uid="bob-uid", email=["bob@example.com"])
+        original.add_contact(alice)
+        original.add_contact(bob)
+        
+        # Save and load multiple times
+        for i in range(3):
+            graph = ContactGraph()
+            if i == 0:
+                graph = original
+            else:
+                graph.load(graph_file)
             
-            assert len(final.get_all_contacts()) == 2
-            assert final.get_contact("alice-uid").fn == "Alice"
-            assert final.get_contact("bob-uid").fn == "Bob"
+            graph.save(graph_file)
+        
+        # Final load and verify
+        final = ContactGraph()
+        final.load(graph_file)
+        
+        assert len(final.get_all_contacts()) == 2
+        assert final.get_contact("alice-uid").fn == "Alice"
+        assert final.get_contact("bob-uid").fn == "Bob"
     
-    def test_update_and_save(self):
+    def test_update_and_save(self, graph_file):
         """Test updating contacts and saving."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graph_file = os.path.join(tmpdir, "update.graphml")
-            
-            # Create and save initial graph
-            graph = ContactGraph()
-            alice = Contact(fn="Alice", uid="alice-uid", email=["old@example.com"])
-            graph.add_contact(alice)
-            graph.save(graph_file)
-            
-            # Load, update, and save
-            graph2 = ContactGraph()
-            graph2.load(graph_file)
-            
-            alice2 = graph2.get_contact("alice-uid")
-            alice2.email = ["new@example.com"]
-            graph2.update_contact(alice2)
-            graph2.save(graph_file)
-            
-            # Verify update persisted
-            graph3 = ContactGraph()
-            graph3.load(graph_file)
-            
-            alice3 = graph3.get_contact("alice-uid")
-            assert alice3.email == ["new@example.com"]
+        # Create and save initial graph
+        graph = ContactGraph()
+        alice = Contact(fn="Alice", uid="alice-uid", email=["old@example.com"])
+        graph.add_contact(alice)
+        graph.save(graph_file)
+        
+        # Load, update, and save
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        alice2 = graph2.get_contact("alice-uid")
+        alice2.email = ["new@example.com"]
+        graph2.update_contact(alice2)
+        graph2.save(graph_file)
+        
+        # Verify update persisted
+        graph3 = ContactGraph()
+        graph3.load(graph_file)
+        
+        alice3 = graph3.get_contact("alice-uid")
+        assert alice3.email == ["new@example.com"]
+    
+    def test_save_escapes_special_characters(self, graph_file):
+        """Test that XML special characters survive a save/load cycle."""
+        graph = ContactGraph()
+        contact = Contact(fn="Smith & <Jones>", uid="smith-uid", note='Says "hi"')
+        graph.add_contact(contact)
+        graph.save(graph_file)
+        
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        loaded = graph2.get_contact("smith-uid")
+        assert loaded.fn == "Smith & <Jones>"
+        assert loaded.note == 'Says "hi"'
+    
+    def test_load_networkx_written_graphml(self, graph_file):
+        """Test loading GraphML written by networkx (generated key ids)."""
+        import networkx as nx
+        
+        
+        legacy = nx.DiGraph()
+        legacy.add_node("alice-uid", fn="Alice", uid="alice-uid", email='["alice@example.com"]')
+        legacy.add_node("bob-uid", fn="Bob", uid="bob-uid")
+        legacy.add_edge("alice-uid", "bob-uid", types='["friend"]', directional=False)
+        nx.write_graphml(legacy, graph_file)
+        
+        graph = ContactGraph()
+        graph.load(graph_file)
+        
+        assert graph.get_contact("alice-uid").email == ["alice@example.com"]
+        rels = graph.get_relationships("alice-uid")
+        assert len(rels) == 1
+        assert rels[0].types == ["friend"]
+        assert rels[0].directional is False
+    
+    def test_graphml_edge_keys_and_none_values(self, graph_file):
+        """Test edge attributes named like node keys and None values."""
+        import networkx as nx
+        from xml.etree import ElementTree
+        
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Alice", uid="alice-uid", note="Node note"))
+        graph.add_contact(Contact(fn="Bob", uid="bob-uid"))
+        graph.graph.add_edge(
+            "alice-uid", "bob-uid",
+            types=["friend"], directional=True, metadata={}, note="Edge note", since=None
+        )
+        graph.save(graph_file)
+        
+        # Key ids are unique and no null placeholder is written
+        root = ElementTree.parse(graph_file).getroot()
+        key_ids = [key.get('id') for key in root.iter('{http://graphml.graphdrawing.org/xmlns}key')]
+        assert len(key_ids) == len(set(key_ids))
+        assert 'None' not in Path(graph_file).read_text(encoding='utf-8')
+        
+        # networkx reads the file with attributes in the right domain
+        legacy = nx.read_graphml(graph_file)
+        assert legacy.nodes["alice-uid"]["note"] == "Node note"
+        assert legacy.edges["alice-uid", "bob-uid"]["note"] == "Edge note"
+        
+        graph2 = ContactGraph()
+        graph2.load(graph_file)
+        
+        assert graph2.get_contact("alice-uid").note == "Node note"
+        edge = graph2.graph.edges["alice-uid", "bob-uid"]
+        assert edge["note"] == "Edge note"
+        assert "since" not in edge
+        assert graph2.get_relationships("alice-uid")[0].types == ["friend"]
+    
+    def test_load_replaces_existing_contacts(self, graph_file):
+        """Test that loading into a populated graph replaces its contacts."""
+        graph = ContactGraph()
+        graph.add_contact(Contact(fn="Alice", uid="alice-uid"))
+        graph.save(graph_file)
+        
+        graph2 = ContactGraph()
+        graph2.add_contact(Contact(fn="Stale", uid="stale-uid"))
+        graph2.load(graph_file)
+        
+        assert graph2.get_contact("stale-uid") is None
+        assert graph2.get_contact("alice-uid").fn == "Alice"
+        
+        graph2.add_contact(Contact(fn="Bob", uid="bob-uid"))
+        assert graph2.get_contact("bob-uid").fn == "Bob"
@@ -2,284 +2,333 @@
 Tests for JSON graph format support.
 """
 import pytest
-import tempfile
 import os
 import json
+from operator import itemgetter
 from datetime import datetime
 from ppl.models import Contact, ContactGraph, Relationship
+from ppl.models import graph as graph_module
+
+# Graphology document schema
+GRAPH_TOP_LEVEL_KEYS = frozenset({"attributes", "options", "nodes", "edges"})
+GRAPH_TYPES = frozenset({"directed", "undirected", "mixed"})
+
+
+def _is_json(content):
+    """Check that graph file content is a JSON graph document."""
+    return '"nodes"' in content and '"edges"' in content
+
+
+def _is_graphml(content):
+    """Check that graph file content is a GraphML document."""
+    return '<?xml' in content or '<graphml' in content
+
+
+@pytest.fixture(scope="module")
+def complex_roundtrip(tmp_path_factory, load_json):
+    """
+    Save a graph with a fully populated contact and a relationship once.
+    
+    Returns:
+        Tuple of (original contact, decoded JSON document, reloaded graph)
+    """
+    contact = Contact(
+        fn="Complex Contact",
+        uid="complex-uid",
+        n="Doe;John;MiddleName;Dr.;Jr.",
+        email=["john@example.com", "john@work.com"],
+        tel=["+1-555-0001", "+1-555-0002"],
+        adr=[";;123 Main St;City;State;12345;Country"],
+        org=["Company Inc"],
+        title="Senior Engineer",
+        role="Developer",
+        note="Important person",
+        categories=["work", "vip"],
+        url=["https://example.com"],
+        bday="1990-01-01",
+        rev=datetime(2024, 10, 12, 19, 0, 0)
+    )
+    other = Contact(fn="Person 2", uid="uid-2")
+    
+    graph = ContactGraph()
+    graph.add_contact(contact)
+    graph.add_contact(other)
+    graph.add_relationship(Relationship(
+        source=contact,
+        target=other,
+        types=["friend", "colleague"],
+        directional=True,
+        metadata={"strength": "strong", "since": "2020"}
+    ))
+    
+    json_file = tmp_path_factory.mktemp("complex") / "complex.json"
+    graph.save(json_file, format='json')
+    
+    graph2 = ContactGraph()
+    graph2.load(json_file, format='json')
+    return contact, load_json(json_file), graph2
 
 
 class TestJSONGraphFormat:
     """Test JSON graph export/import functionality."""
     
-    def test_save_and_load_json_format(self):
+    def test_save_and_load_json_format(self, tmp_path, load_json, alice, bob):
         """Test saving and loading graph in JSON format."""
         graph = ContactGraph()
         
         # Add contacts
-        contact1 = Contact(
-            fn="Alice Johnson",
-            uid="alice-uid",
-            email=["alice@example.com"],
-            tel=["+1-555-0001"],
-            title="Engineer"
-        )
-        
-        contact2 = Contact(
-            fn="Bob Smith",
-            uid="bob-uid",
-            email=["bob@example.com"],
-            title="Manager"
-        )
-        
-        graph.add_contact(contact1)
-        graph.add_contact(contact2)
+        graph.add_contact(alice)
+        graph.add_contact(bob)
         
         # Add relationship
         rel = Relationship(
-            source=contact1,
-            target=contact2,
+            source=alice,
+            target=bob,
             types=["colleague", "friend"],
             directional=True
         )
         graph.add_relationship(rel)
         
         # Save to JSON
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "graph.json")
-            graph.save(json_file, format='json')
-            
-            # Verify file exists and is valid JSON
-            assert os.path.exists(json_file)
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            
-            # Verify JSON structure
-            assert "attributes" in data
-            assert "options" in data
-            assert "nodes" in data
-            assert "edges" in data
-            
-            # Verify options
-            assert data["options"]["type"] == "directed"
-            assert data["options"]["allowSelfLoops"] is True
-            assert data["options"]["multi"] is False
-            
-            # Verify nodes
-            assert len(data["nodes"]) == 2
-            node_keys = {node["key"] for node in data["nodes"]}
-            assert "alice-uid" in node_keys
-            assert "bob-uid" in node_keys
-            
-            # Verify edges
-            assert len(data["edges"]) == 1
-            edge = data["edges"][0]
-            assert edge["source"] == "alice-uid"
-            assert edge["target"] == "bob-uid"
-            assert "key" in edge
-            
-            # Load from JSON
-            graph2 = ContactGraph()
-            graph2.load(json_file, format='json')
-            
-            # Verify loaded contacts
-            loaded_alice = graph2.get_contact("alice-uid")
-            assert loaded_alice is not None
-            assert loaded_alice.fn == "Alice Johnson"
-            assert loaded_alice.email == ["alice@example.com"]
-            assert loaded_alice.title == "Engineer"
-            
-            loaded_bob = graph2.get_contact("bob-uid")
-            assert loaded_bob is not None
-            assert loaded_bob.fn == "Bob Smith"
-            
-            # Verify relationships
-            rels = graph2.get_relationships("alice-uid")
-            assert len(rels) == 1
-            assert rels[0].target.uid == "bob-uid"
-    
-    def test_auto_detect_json_extension(self):
-        """Test that JSON format is auto-detected from .json extension."""
-        graph = ContactGraph()
-        contact = Contact(fn="Test", uid="test-uid")
-        graph.add_contact(contact)
+        json_file = tmp_path / "graph.json"
+        graph.save(json_file, format='json')
+        
+        # Verify file exists and is valid JSON
+        assert os.path.exists(json_file)
+        data = load_json(json_file)
+        
+        # Verify JSON structure
+        assert "attributes" in data
+        assert "options" in data
+        assert "nodes" in data
+        assert "edges" in data
+        
+        # Verify options
+        assert data["options"]["type"] == "directed"
+        assert data["options"]["allowSelfLoops"] is True
+        assert data["options"]["multi"] is False
+        
+        # Verify nodes
+        assert len(data["nodes"]) == 2
+        node_keys = set(map(itemgetter("key"), data["nodes"]))
+        assert "alice-uid" in node_keys
+        assert "bob-uid" in node_keys
+        
+        # Verify edges
+        assert len(data["edges"]) == 1
+        edge = data["edges"][0]
+        assert edge["source"] == "alice-uid"
+        assert edge["target"] == "bob-uid"
+        assert "key" in edge
+        
+        # Load from JSON
+        graph2 = ContactGraph()
+        graph2.load(json_file, format='json')
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "contacts.json")
-            
-            # Save without specifying format
-            graph.save(json_file)
-            
-            # Verify it's JSON
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            assert "nodes" in data
-            assert "edges" in data
-            
-            # Load without specifying format
-            graph2 = ContactGraph()
-            graph2.load(json_file)
-            
-            loaded = graph2.get_contact("test-uid")
-            assert loaded is not None
-            assert loaded.fn == "Test"
+        # Verify loaded contacts
+        loaded_alice = graph2.get_contact("alice-uid")
+        assert loaded_alice is not None
+        assert loaded_alice.fn == "Alice Johnson"
+        assert loaded_alice.email == ["alice@example.com"]
+        assert loaded_alice.title == "Engineer"
+        
+        loaded_bob = graph2.get_contact("bob-uid")
+        assert loaded_bob is not None
+        assert loaded_bob.fn == "Bob Smith"
+        
+        # Verify relationships
+        rels = graph2.get_relationships("alice-uid")
+        assert len(rels) == 1
+        assert rels[0].target.uid == "bob-uid"
     
-    def test_auto_detect_graphml_extension(self):
-        """Test that GraphML format is auto-detected from .graphml extension."""
+    @pytest.mark.parametrize("filename,fmt,sniff", [
+        # Format auto-detected from extension
+        ("contacts.json", None, _is_json),
+        ("contacts.graphml", None, _is_graphml),
+        # Explicit format overrides extension
+        ("contacts.json", "json", _is_json),
+        ("graph.txt", "json", _is_json),
+        ("graph.db", "json", _is_json),
+    ])
+    def test_format_roundtrip(self, tmp_path, filename, fmt, sniff):
+        """Test saving and loading with detected or explicit format."""
         graph = ContactGraph()
         contact = Contact(fn="Test", uid="test-uid")
         graph.add_contact(contact)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            graphml_file = os.path.join(tmpdir, "contacts.graphml")
-            
-            # Save without specifying format
-            graph.save(graphml_file)
-            
-            # Verify it's GraphML (XML)
-            with open(graphml_file, 'r') as f:
-                content = f.read()
-            assert '<?xml' in content or '<graphml' in content
-            
-            # Load without specifying format
-            graph2 = ContactGraph()
-            graph2.load(graphml_file)
-            
-            loaded = graph2.get_contact("test-uid")
-            assert loaded is not None
-            assert loaded.fn == "Test"
+        graph_file = tmp_path / filename
+        graph.save(graph_file, format=fmt)
+        
+        # Verify the file was written in the expected format
+        assert sniff(graph_file.read_text(encoding='utf-8'))
+        
+        graph2 = ContactGraph()
+        graph2.load(graph_file, format=fmt)
+        
+        loaded = graph2.get_contact("test-uid")
+        assert loaded is not None
+        assert loaded.fn == "Test"
     
-    def test_json_preserves_all_contact_fields(self):
+    def test_json_preserves_all_contact_fields(self, complex_roundtrip):
         """Test that JSON format preserves all contact fields."""
-        graph = ContactGraph()
+        contact, _, graph2 = complex_roundtrip
+        
+        # Dataclass equality compares every field in one structural check
+        assert graph2.get_contact("complex-uid") == contact
+    
+    def test_json_preserves_edge_attributes(self, complex_roundtrip):
+        """Test that JSON format preserves edge attributes."""
+        _, data, graph2 = complex_roundtrip
         
-        contact = Contact(
-            fn="Complex Contact",
-            uid="complex-uid",
-            n="Doe;John;MiddleName;Dr.;Jr.",
-            email=["john@example.com", "john@work.com"],
-            tel=["+1-555-0001", "+1-555-0002"],
-            adr=[";;123 Main St;City;State;12345;Country"],
-            org=["Company Inc"],
-            title="Senior Engineer",
-            role="Developer",
-            note="Important person",
-            categories=["work", "vip"],
-            url=["https://example.com"],
-            bday="1990-01-01",
-            rev=datetime(2024, 10, 12, 19, 0, 0)
+        # Verify JSON structure
+        edge = data["edges"][0]
+        assert edge["attributes"]["types"] == ["friend", "colleague"]
+        assert edge["attributes"]["directional"] is True
+        assert edge["attributes"]["metadata"]["strength"] == "strong"
+        
+        # Verify the loaded relationship
+        rels = graph2.get_relationships("complex-uid")
+        assert len(rels) == 1
+        loaded = {
+            "types": rels[0].types,
+            "directional": rels[0].directional,
+            "metadata": rels[0].metadata,
+        }
+        assert loaded == {
+            "types": ["friend", "colleague"],
+            "directional": True,
+            "metadata": {"strength": "strong", "since": "2020"},
+        }
+    
+    def test_json_load_validates_contacts(self, tmp_path):
+        """Test that loading a node without an FN is rejected."""
+        json_file = tmp_path / "invalid.json"
+        json_file.write_text(
+            '{"attributes": {}, "options": {"type": "directed"}, '
+            '"nodes": [{"key": "x", "attributes": {"fn": "", "uid": "x"}}], '
+            '"edges": []}',
+            encoding='utf-8'
         )
         
-        graph.add_contact(contact)
+        with pytest.raises(ValueError, match="FN .* is required"):
+            ContactGraph().load(json_file, format='json')
+    
+    def test_json_empty_graph(self, tmp_path, load_json):
+        """Test saving and loading an empty graph in JSON format."""
+        graph = ContactGraph()
+        
+        json_file = tmp_path / "empty.json"
+        graph.save(json_file, format='json')
+        
+        # Verify structure
+        data = load_json(json_file)
+        
+        assert data["nodes"] == []
+        assert data["edges"] == []
+        
+        # Load and verify
+        graph2 = ContactGraph()
+        graph2.load(json_file, format='json')
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "complex.json")
-            graph.save(json_file, format='json')
-            
-            # Load and verify
-            graph2 = ContactGraph()
-            graph2.load(json_file, format='json')
-            
-            loaded = graph2.get_contact("complex-uid")
-            assert loaded.fn == "Complex Contact"
-            assert loaded.n == "Doe;John;MiddleName;Dr.;Jr."
-            assert loaded.email == ["john@example.com", "john@work.com"]
-            assert loaded.tel == ["+1-555-0001", "+1-555-0002"]
-            assert loaded.title == "Senior Engineer"
-            assert loaded.role == "Developer"
-            assert loaded.note == "Important person"
-            assert loaded.categories == ["work", "vip"]
-            assert loaded.bday == "1990-01-01"
-            assert loaded.rev == datetime(2024, 10, 12, 19, 0, 0)
+        assert len(graph2.get_all_contacts()) == 0
     
-    def test_json_preserves_edge_attributes(self):
-        """Test that JSON format preserves edge attributes."""
+    def test_json_output_matches_stdlib_encoder(self, tmp_path, monkeypatch):
+        """Test that the orjson and stdlib write paths produce identical files."""
         graph = ContactGraph()
+        alice = Contact(fn="Zoë Smith", uid="alice-uid", note="Line one\nLine two")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        graph.add_relationship(Relationship(
+            source=alice,
+            target=bob,
+            types=["friend"],
+            metadata={"weight": 0.5, "tags": []}
+        ))
         
-        contact1 = Contact(fn="Person 1", uid="uid-1")
-        contact2 = Contact(fn="Person 2", uid="uid-2")
+        default_file = tmp_path / "default.json"
+        stdlib_file = tmp_path / "stdlib.json"
+        graph.save(default_file, format='json')
+        monkeypatch.setattr(graph_module, "orjson", None)
+        graph.save(stdlib_file, format='json')
         
-        graph.add_contact(contact1)
-        graph.add_contact(contact2)
+        assert default_file.read_bytes() == stdlib_file.read_bytes()
+    
+    def test_json_datetime_matches_stdlib_encoder(self, tmp_path, monkeypatch, load_json):
+        """Test that datetime metadata is written the same by orjson and stdlib."""
+        graph = ContactGraph()
+        alice = Contact(fn="Alice", uid="alice-uid")
+        bob = Contact(fn="Bob", uid="bob-uid")
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        graph.add_relationship(Relationship(
+            source=alice,
+            target=bob,
+            types=["friend"],
+            metadata={"since": datetime(2020, 1, 2, 3, 4, 5)}
+        ))
         
-        # Add relationship with metadata
-        rel = Relationship(
-            source=contact1,
-            target=contact2,
-            types=["friend", "colleague"],
-            directional=True,
-            metadata={"strength": "strong", "since": "2020"}
-        )
-        graph.add_relationship(rel)
+        default_file = tmp_path / "default.json"
+        stdlib_file = tmp_path / "stdlib.json"
+        graph.save(default_file, format='json')
+        monkeypatch.setattr(graph_module, "orjson", None)
+        graph.save(stdlib_file, format='json')
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "edges.json")
-            graph.save(json_file, format='json')
-            
-            # Verify JSON structure
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            
-            edge = data["edges"][0]
-            assert edge["attributes"]["types"] == ["friend", "colleague"]
-            assert edge["attributes"]["directional"] is True
-            assert edge["attributes"]["metadata"]["strength"] == "strong"
-            
-            # Load and verify
-            graph2 = ContactGraph()
-            graph2.load(json_file, format='json')
-            
-            rels = graph2.get_relationships("uid-1")
-            assert len(rels) == 1
-            assert rels[0].types == ["friend", "colleague"]
-            assert rels[0].directional is True
-            assert rels[0].metadata["strength"] == "strong"
+        assert default_file.read_bytes() == stdlib_file.read_bytes()
+        edge = load_json(stdlib_file)["edges"][0]
+        assert edge["attributes"]["metadata"]["since"] == "2020-01-02T03:04:05"
     
-    def test_json_empty_graph(self):
-        """Test saving and loading an empty graph in JSON format."""
+    def test_json_floats_match_stdlib_encoder(self, monkeypatch):
+        """Test that floats decode equally from orjson and stdlib output."""
+        pytest.importorskip("orjson")
+        data = {"values": [1e16, 1e-7, 0.1, -2.5]}
+        
+        default_data = json.loads(graph_module._dump_json(data))
+        monkeypatch.setattr(graph_module, "orjson", None)
+        stdlib_data = json.loads(graph_module._dump_json(data))
+        
+        assert default_data == stdlib_data == data
+    
+    def test_msgpack_roundtrip(self, tmp_path):
+        """Test saving and loading the msgpack format detected from extension."""
+        msgpack = pytest.importorskip("msgpack")
         graph = ContactGraph()
+        alice = Contact(fn="Alice", uid="alice-uid", email=["alice@example.com"])
+        bob = Contact(fn="Bob", uid="bob-uid")
+        graph.add_contact(alice)
+        graph.add_contact(bob)
+        graph.add_relationship(Relationship(
+            source=alice,
+            target=bob,
+            types=["friend"],
+            directional=True,
+            metadata={"since": "2020"}
+        ))
+        
+        msgpack_file = tmp_path / "contacts.msgpack"
+        graph.save(msgpack_file)
+        
+        data = msgpack.unpackb(msgpack_file.read_bytes(), raw=False)
+        assert data.keys() == GRAPH_TOP_LEVEL_KEYS
+        
+        graph2 = ContactGraph()
+        graph2.load(msgpack_file)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "empty.json")
-            graph.save(json_file, format='json')
-            
-            # Verify structure
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            
-            assert data["nodes"] == []
-            assert data["edges"] == []
-            
-            # Load and verify
-            graph2 = ContactGraph()
-            graph2.load(json_file, format='json')
-            
-            assert len(graph2.get_all_contacts()) == 0
+        assert graph2.get_contact("alice-uid") == alice
+        rels = graph2.get_relationships("alice-uid")
+        assert len(rels) == 1
+        assert rels[0].target.uid == "bob-uid"
+        assert rels[0].metadata == {"since": "2020"}
     
-    def test_json_format_explicit(self):
-        """Test explicitly specifying JSON format."""
+    def test_msgpack_requires_package(self, tmp_path, monkeypatch):
+        """Test that the msgpack format reports a missing dependency."""
+        monkeypatch.setattr(graph_module, "msgpack", None)
         graph = ContactGraph()
-        contact = Contact(fn="Test", uid="test-uid")
-        graph.add_contact(contact)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Save with .txt extension but explicit JSON format
-            file_path = os.path.join(tmpdir, "graph.txt")
-            graph.save(file_path, format='json')
-            
-            # Verify it's JSON
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            assert "nodes" in data
-            
-            # Load with explicit format
-            graph2 = ContactGraph()
-            graph2.load(file_path, format='json')
-            
-            loaded = graph2.get_contact("test-uid")
-            assert loaded is not None
+        with pytest.raises(ImportError, match="msgpack"):
+            graph.save(tmp_path / "contacts.msgpack")
     
-    def test_json_schema_compliance(self):
+    def test_json_schema_compliance(self, tmp_path, load_json):
         """Test that exported JSON matches the expected schema."""
         graph = ContactGraph()
         
@@ -297,40 +346,38 @@ class TestJSONGraphFormat:
         )
         graph.add_relationship(rel)
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_file = os.path.join(tmpdir, "schema.json")
-            graph.save(json_file, format='json')
-            
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            
-            # Verify top-level structure
-            assert set(data.keys()) == {"attributes", "options", "nodes", "edges"}
-            
-            # Verify attributes
-            assert isinstance(data["attributes"], dict)
-            assert "name" in data["attributes"]
-            
-            # Verify options
-            assert data["options"]["allowSelfLoops"] in [True, False]
-            assert data["options"]["multi"] in [True, False]
-            assert data["options"]["type"] in ["directed", "undirected", "mixed"]
-            
-            # Verify nodes structure
-            for node in data["nodes"]:
-                assert "key" in node
-                assert isinstance(node["key"], str)
-                # attributes is optional but if present should be dict
-                if "attributes" in node:
-                    assert isinstance(node["attributes"], dict)
-            
-            # Verify edges structure
-            for edge in data["edges"]:
-                assert "key" in edge
-                assert "source" in edge
-                assert "target" in edge
-                assert isinstance(edge["source"], str)
-                assert isinstance(edge["target"], str)
-                # attributes is optional but if present should be dict
-                if "attributes" in edge:
-                    assert isinstance(edge["attributes"], dict)
+        json_file = tmp_path / "schema.json"
+        graph.save(json_file, format='json')
+        
+        data = load_json(json_file)
+        
+        # Verify top-level structure
+        assert data.keys() == GRAPH_TOP_LEVEL_KEYS
+        
+        # Verify attributes
+        assert isinstance(data["attributes"], dict)
+        assert "name" in data["attributes"]
+        
+        # Verify options
+        assert data["options"]["allowSelfLoops"] in [True, False]
+        assert data["options"]["multi"] in [True, False]
+        assert data["options"]["type"] in GRAPH_TYPES
+        
+        # Verify nodes structure
+        for node in data["nodes"]:
+            assert "key" in node
+            assert isinstance(node["key"], str)
+            # attributes is optional but if present should be dict
+            if "attributes" in node:
+                assert isinstance(node["attributes"], dict)
+        
+        # Verify edges structure
+        for edge in data["edges"]:
+            assert "key" in edge
+            assert "source" in edge
+            assert "target" in edge
+            assert isinstance(edge["source"], str)
+            assert isinstance(edge["target"], str)
+            # attributes is optional but if present should be dict
+            if "attributes" in edge:
+                assert isinstance(edge["attributes"], dict)
@@ -72,6 +72,16 @@ EMAIL:
         assert front_matter['UID'] == "jane-uid"
         assert "jane@example.com" in front_matter['EMAIL']
     
+    def test_parsed_front_matter_is_not_shared(self):
+        """Test that repeated parses of the same front matter are independent."""
+        md_str = "---\nFN: Jane Smith\nEMAIL:\n  - jane@example.com\n---\n\n# Jane Smith\n"
+        
+        contact1 = markdown.from_markdown(md_str)
+        contact1.email.append("other@example.com")
+        contact2 = markdown.from_markdown(md_str)
+        
+        assert contact2.email == ["jane@example.com"]
+    
     def test_parse_yaml_front_matter_empty(self):
         """Test parsing markdown without front matter."""
         md_str = "# John Doe\n\nSome content"
@@ -107,6 +117,20 @@ EMAIL:
         assert any(r['types'] == ['friend'] for r in relationships)
         assert any(r['types'] == ['colleague'] for r in relationships)
     
+    def test_parse_related_section_absent(self):
+        """Test parsing a body without a Related section."""
+        md_body = "# John Doe\n\nSome content\n\n- a list item\n"
+        
+        assert markdown.parse_related_section(md_body) == []
+    
+    def test_parse_related_section_heading_case(self):
+        """Test that the Related heading is matched case-insensitively."""
+        md_body = "# John Doe\n\n## RELATED\n\n- friend [[Bob]]\n"
+        
+        relationships = markdown.parse_related_section(md_body)
+        
+        assert [r['text_value'] for r in relationships] == ['Bob']
+    
     def test_parse_related_section_with_uri(self):
         """Test parsing related section with URIs."""
         md_body = """# John Doe
@@ -206,6 +230,32 @@ VERSION: '4.0'
             assert any(c.fn == "Bob" for c in imported)
             assert any(c.fn == "Charlie" for c in imported)
     
+    def test_bulk_import_skips_non_markdown(self):
+        """Test that bulk import only reads .md files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            markdown.bulk_export_markdown([Contact(fn="Alice")], tmpdir)
+            Path(tmpdir, "notes.txt").write_text("not markdown", encoding='utf-8')
+            Path(tmpdir, "folder.md").mkdir()
+            
+            imported = markdown.bulk_import_markdown(tmpdir)
+            
+            assert [c.fn for c in imported] == ["Alice"]
+        
+        assert markdown.bulk_import_markdown("/nonexistent/folder") == []
+    
+    def test_bulk_import_processes(self):
+        """Test bulk import in worker processes matches sequential results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contacts = [
+                Contact(fn=f"Contact {i}", uid=f"uid-{i}")
+                for i in range(10)
+            ]
+            markdown.bulk_export_markdown(contacts, tmpdir)
+            
+            imported = markdown.bulk_import_markdown(tmpdir, workers=2, processes=True)
+            
+            assert sorted(c.uid for c in imported) == sorted(c.uid for c in contacts)
+    
     def test_resolve_wiki_link(self):
         """Test resolving wiki-style links."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -224,6 +274,37 @@ VERSION: '4.0'
             assert resolved.fn == "Bob Smith"
             assert resolved.uid == "bob-uid"
     
+    def test_resolve_wiki_link_by_fn(self):
+        """Test resolving a wiki link from the FN of a differently named file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contact = Contact(fn="Bob Smith", uid="bob-uid")
+            Path(tmpdir, "bob.md").write_text(markdown.to_markdown(contact), encoding='utf-8')
+            Path(tmpdir, "plain.md").write_text("# No front matter\n", encoding='utf-8')
+            
+            resolved = markdown.resolve_wiki_link("Bob Smith", tmpdir)
+            
+            assert resolved is not None
+            assert resolved.uid == "bob-uid"
+    
+    def test_bulk_import_front_matter_only(self):
+        """Test importing only front matter skips the Related section of the body."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contact = Contact(
+                fn="Alice",
+                uid="alice-uid",
+                note="Met at work",
+                related=[Related(uri="urn:uuid:bob-uid", type=["friend"])]
+            )
+            markdown.bulk_export_markdown([contact], tmpdir)
+            
+            imported = markdown.bulk_import_markdown(tmpdir, body=False)
+            
+            assert len(imported) == 1
+            assert imported[0].uid == "alice-uid"
+            assert imported[0].note == "Met at work"
+            # Only the RELATED entries stored in the front matter are kept
+            assert imported[0].related == contact.related
+    
     def test_resolve_wiki_link_not_found(self):
         """Test resolving non-existent wiki link."""
         with tempfile.TemporaryDirectory() as tmpdir:
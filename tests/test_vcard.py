@@ -4,6 +4,7 @@ Unit tests for vCard serializer.
 import pytest
 import tempfile
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -59,6 +60,54 @@ class TestVCardSerializer:
         assert "urn:uuid:charlie-uid" in vcard_str
         assert "friend" in vcard_str or "colleague" in vcard_str
     
+    def test_to_vcard_reflects_mutation(self):
+        """Test that cached serialization is refreshed after a contact changes."""
+        contact = Contact(fn="John Doe", email=["john@example.com"])
+        first = vcard.to_vcard(contact)
+        assert vcard.to_vcard(contact) == first
+        
+        contact.email.append("jdoe@work.com")
+        assert "jdoe@work.com" in vcard.to_vcard(contact)
+    
+    def test_to_vcard_caches_only_in_scope(self):
+        """Test that serialized output is cached only inside contact_cache()."""
+        from ppl.serializers import _cache
+        
+        contact = Contact(fn="John Doe", email=["john@example.com"])
+        assert vcard.to_vcard(contact) is not vcard.to_vcard(contact)
+        
+        with _cache.contact_cache():
+            first = vcard.to_vcard(contact)
+            assert vcard.to_vcard(contact) is first
+            assert vcard.to_vcard(Contact(fn="John Doe", email=["john@example.com"])) is not first
+        
+        # Leaving the scope releases every cached result
+        assert not _cache._thread_caches()
+    
+    def test_to_vcard_cache_scope_is_per_thread(self):
+        """Test that a contact_cache() open in another thread is not shared."""
+        from ppl.serializers import _cache
+        
+        opened = threading.Event()
+        done = threading.Event()
+        
+        def hold_scope():
+            with _cache.contact_cache():
+                opened.set()
+                done.wait(5)
+        
+        worker = threading.Thread(target=hold_scope)
+        worker.start()
+        try:
+            assert opened.wait(5)
+            contact = Contact(fn="John Doe")
+            vcard.to_vcard(contact)
+            contact.title = "CEO"
+            assert "TITLE:CEO" in vcard.to_vcard(contact)
+        finally:
+            done.set()
+            worker.join()
+    
     def test_from_vcard_minimal(self):
         """Test parsing a minimal vCard."""
         vcard_str = """BEGIN:VCARD
@@ -188,6 +237,56 @@ END:VCARD"""
             assert any(c.fn == "Bob" for c in imported)
             assert any(c.fn == "Charlie" for c in imported)
     
+    def test_bulk_import_export_workers(self):
+        """Test bulk operations on a thread pool match sequential results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contacts = [
+                Contact(fn=f"Contact {i}", uid=f"uid-{i}")
+                for i in range(10)
+            ]
+            # Duplicate FN shares a file and must be handled in order
+            contacts.append(Contact(fn="Contact 0", uid="uid-0", note="updated"))
+            
+            written, skipped = vcard.bulk_export(contacts, tmpdir, workers=4)
+            assert (written, skipped) == (11, 0)
+            
+            imported = vcard.bulk_import(tmpdir, workers=4)
+            assert len(imported) == 10
+            by_uid = {c.uid: c for c in imported}
+            assert by_uid["uid-0"].note == "updated"
+            
+            # Unchanged files are skipped on the next export
+            assert vcard.bulk_export(contacts[:10], tmpdir, workers=4) == (1, 9)
+    
+    def test_bulk_export_checks_case_variant_files(self, monkeypatch):
+        """Test that a file differing only in case is not treated as new."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "alice.vcf").write_text("existing", encoding='utf-8')
+            checked = []
+            
+            def should_export(contact, file_path):
+                checked.append(contact.fn)
+                return False
+            
+            monkeypatch.setattr(vcard, "should_export_vcard", should_export)
+            
+            # On case-insensitive filesystems Alice.vcf is the existing file
+            assert vcard.bulk_export([Contact(fn="Alice")], tmpdir) == (0, 1)
+            assert checked == ["Alice"]
+    
+    def test_iter_vcards(self):
+        """Test lazily importing only .vcf files from a folder."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            vcard.bulk_export([Contact(fn="Alice"), Contact(fn="Bob")], tmpdir)
+            Path(tmpdir, "notes.txt").write_text("not a vcard", encoding='utf-8')
+            Path(tmpdir, "folder.vcf").mkdir()
+            
+            contacts = vcard.iter_vcards(tmpdir)
+            assert not isinstance(contacts, list)
+            assert sorted(c.fn for c in contacts) == ["Alice", "Bob"]
+        
+        assert list(vcard.iter_vcards("/nonexistent/folder")) == []
+    
     def test_extract_relationships(self):
         """Test extracting relationships from a contact."""
         contact = Contact(
@@ -180,6 +180,35 @@ VERSION: '4.0'
         assert parsed.fn == original.fn
         assert parsed.uid == original.uid
         assert "jane@example.com" in parsed.email
+    
+    def test_related_types_are_interned(self):
+        """Test that parsed RELATED types share one string per label."""
+        original = Contact(
+            fn="Alice",
+            related=[Related(uri="urn:uuid:bob-uid", type=["friend"])]
+        )
+        yaml_str = yaml_serializer.to_yaml(original)
+        
+        parsed1 = yaml_serializer.from_yaml(yaml_str)
+        parsed2 = yaml_serializer.from_yaml(yaml_str)
+        
+        assert parsed1.related[0].type == ["friend"]
+        assert parsed1.related[0].type[0] is parsed2.related[0].type[0]
+    
+    def test_flat_yaml_roundtrip_with_related(self):
+        """Test flat YAML roundtrip of nested RELATED entries."""
+        original = Contact(
+            fn="Alice",
+            uid="alice-uid",
+            related=[
+                Related(uri="urn:uuid:bob-uid", type=["friend", "colleague"]),
+                Related(uri="urn:uuid:carol-uid", type=["sibling"], pref=1)
+            ]
+        )
+        
+        parsed = yaml_serializer.from_flat_yaml(yaml_serializer.to_flat_yaml(original))
+        
+        assert parsed.related == original.related
 
 
 class TestYAMLHelpers:
@@ -210,3 +239,9 @@ class TestYAMLHelpers:
         
         assert 'a' in d
         assert d['a']['b'] == 'c'
+    
+    def test_unflatten_dict_nested_lists(self):
+        """Test unflattening lists of dictionaries."""
+        d = {'a': [{'b': 'c', 'd': ['e', 'f']}, {'b': 'g'}], 'h': 'i'}
+        
+        assert yaml_serializer._unflatten_dict(yaml_serializer._flatten_dict(d)) == d